@@ -5,16 +5,9 @@ This package contains benchmark agents and tests for evaluating the Orion framew
 performance across different complexity levels and use cases.
 """
 
-# Real-world problem-solving agents for practical use cases
-from .agents import (
-    FinancialAnalysisAgent,
-    MarketIntelligenceAgent,
-    MusicTherapyAgent,
-    NutritionalWellnessAgent,
-    CareerDevelopmentAgent,
-    WebResearchAgent
-)
+import importlib
 
+# Real-world problem-solving agents for practical use cases, loaded on first access
 __all__ = [
     "FinancialAnalysisAgent",
     "MarketIntelligenceAgent", 
@@ -24,4 +17,16 @@ __all__ = [
     "WebResearchAgent"
 ]
 
-__version__ = "1.0.0" 
\ No newline at end of file
+__version__ = "1.0.0" 
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = getattr(importlib.import_module(".agents", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
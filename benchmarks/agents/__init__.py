@@ -1,14 +1,21 @@
 """
 Benchmark agents for Orion framework testing.
+
+Agent classes are imported lazily (PEP 562) so that using one agent does not
+pay the import cost of every other agent module.
 """
 
+import importlib
+
 # Real-world problem-solving agents
-from .advanced_calculator_agent import FinancialAnalysisAgent
-from .market_intelligence_agent import MarketIntelligenceAgent
-from .music_therapy_agent import MusicTherapyAgent
-from .nutritional_wellness_agent import NutritionalWellnessAgent
-from .career_development_agent import CareerDevelopmentAgent
-from .web_research_agent import WebResearchAgent
+_LAZY_AGENTS = {
+    "FinancialAnalysisAgent": ".advanced_calculator_agent",
+    "MarketIntelligenceAgent": ".market_intelligence_agent",
+    "MusicTherapyAgent": ".music_therapy_agent",
+    "NutritionalWellnessAgent": ".nutritional_wellness_agent",
+    "CareerDevelopmentAgent": ".career_development_agent",
+    "WebResearchAgent": ".web_research_agent",
+}
 
 __all__ = [
     "FinancialAnalysisAgent",
@@ -17,4 +24,16 @@ __all__ = [
     "NutritionalWellnessAgent",
     "CareerDevelopmentAgent",
     "WebResearchAgent"
-] 
\ No newline at end of file
+] 
+
+
+def __getattr__(name):
+    if name in _LAZY_AGENTS:
+        value = getattr(importlib.import_module(_LAZY_AGENTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
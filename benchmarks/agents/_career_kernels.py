@@ -0,0 +1,32 @@
+"""
+Numeric kernels used by the career development tools.
+
+Compiled with Numba when it is available (see ``_jit``). Only the salary aggregation
+lives here: skill counting stays a ``Counter`` in ``analyze_job_market``, whose
+first-seen tie order a fixed-ID histogram would not preserve, and there are only
+ten skills to count. The tool reports no salary spread, so no deviation is computed.
+"""
+
+import numpy as np
+
+from ._jit import njit
+
+
+@njit(cache=True)
+def salary_stats(salaries):
+    """Single-pass (mean, min, max) of a non-empty salary array using Welford's running mean."""
+    mean = 0.0
+    lo = salaries[0]
+    hi = salaries[0]
+    for i in range(salaries.shape[0]):
+        value = salaries[i]
+        mean += (value - mean) / (i + 1)
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    return mean, lo, hi
+
+
+# Warm up at import
+salary_stats(np.ones(1, dtype=np.float64))
@@ -0,0 +1,95 @@
+"""
+Helpers shared by the benchmark agents.
+"""
+
+import copy
+import asyncio
+import weakref
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping
+
+from orion.agent_core.utils import function_to_schema
+from orion.graph_core import WorkflowGraph
+
+# asyncio locks bind to the first event loop that contends them, so a lock shared across
+# asyncio.run() calls breaks the second loop. Locks are kept per running loop instead and
+# are dropped together with their loop.
+_LOOP_LOCKS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Lock]]" = weakref.WeakKeyDictionary()
+
+
+def loop_lock(key: Hashable) -> asyncio.Lock:
+    """Return the lock for ``key`` on the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    locks = _LOOP_LOCKS.get(loop)
+    if locks is None:
+        locks = _LOOP_LOCKS[loop] = {}
+    return locks.setdefault(key, asyncio.Lock())
+
+
+# Tool schemas keyed by (function, function_to_schema kwargs); enhanced descriptions cost an LLM call each.
+_SCHEMA_CACHE: Dict[Hashable, Dict[str, Any]] = {}
+
+
+async def cached_schema(func, **kwargs) -> Dict[str, Any]:
+    """Return ``function_to_schema(func, **kwargs)``, computing it at most once per process.
+
+    Concurrent callers on the same loop wait for the first build instead of repeating it.
+    """
+    key = (func, tuple(sorted(kwargs.items())))
+    if key not in _SCHEMA_CACHE:
+        async with loop_lock(key):
+            if key not in _SCHEMA_CACHE:
+                _SCHEMA_CACHE[key] = await function_to_schema(func, **kwargs)
+    return _SCHEMA_CACHE[key]
+
+
+class WorkflowPrototypes:
+    """Workflow graphs built once per key and handed out as deep copies.
+
+    Building a workflow generates tool schemas (an LLM call each) and constructs the agents, so
+    it is done once per key and process. Concurrent callers on the same loop wait for the first
+    build instead of repeating it. Callers always get their own copy, so compiling and executing
+    one copy never leaks state into another.
+    """
+
+    def __init__(self):
+        self._prototypes: Dict[Hashable, WorkflowGraph] = {}
+
+    async def warmup(self, key: Hashable, build: Callable[[], Awaitable[WorkflowGraph]]) -> None:
+        """Build the prototype for ``key`` with ``build`` unless it already exists."""
+        if key in self._prototypes:
+            return
+        async with loop_lock((self, key)):
+            if key not in self._prototypes:
+                self._prototypes[key] = await build()
+
+    async def copy(self, key: Hashable, build: Callable[[], Awaitable[WorkflowGraph]]) -> WorkflowGraph:
+        """Return a deep copy of the prototype for ``key``, building it first if needed."""
+        await self.warmup(key, build)
+        return copy.deepcopy(self._prototypes[key])
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy of ``value``: mappings become ``MappingProxyType``, lists and tuples tuples.
+
+    For module-level templates that cached results share; ``thaw`` turns them back into plain
+    containers when a tool returns them.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Deep copy ``value`` into plain containers: mappings become dicts, lists and tuples lists.
+
+    Tools that memoize their results hand each caller ``thaw(cached)``, so a caller mutating
+    its result can never change what later calls return.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
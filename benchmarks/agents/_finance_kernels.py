@@ -0,0 +1,34 @@
+"""
+Numeric kernels shared by the financial analysis tools.
+
+The annuity formulas are compiled with Numba when it is available (see ``_jit``)
+so repeated tool calls run as native code.
+Compound growth (1 + r)^n is evaluated as exp(n * log1p(r)), which stays
+accurate for the small periodic rates typical of monthly compounding.
+"""
+
+import math
+
+from ._jit import njit
+
+
+@njit(cache=True)
+def monthly_payment(principal: float, rate: float, periods: float) -> float:
+    """Level payment that amortizes ``principal`` over ``periods`` at periodic ``rate``."""
+    if rate == 0.0:
+        return principal / periods
+    log_growth = periods * math.log1p(rate)
+    return principal * (rate * math.exp(log_growth)) / math.expm1(log_growth)
+
+
+@njit(cache=True)
+def annuity_fv(payment: float, rate: float, periods: float) -> float:
+    """Future value of ``periods`` equal payments compounded at periodic ``rate``."""
+    if rate == 0.0:
+        return payment * periods
+    return payment * (math.expm1(periods * math.log1p(rate)) / rate)
+
+
+# Warm up at import
+monthly_payment(1.0, 0.01, 12.0)
+annuity_fv(1.0, 0.01, 12.0)
@@ -0,0 +1,18 @@
+"""
+Numba ``njit`` for the agents' numeric kernels, with a pure-Python fallback.
+
+Kernel modules decorate with ``@njit(cache=True)`` and call every kernel once at import with
+representative arguments, so compilation (or loading from Numba's on-disk cache) happens up
+front and tool calls never pay JIT latency. Without Numba the decorator is a no-op and the
+kernels run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+__all__ = ["njit"]
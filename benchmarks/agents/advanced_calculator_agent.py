@@ -5,17 +5,25 @@ Helps users make informed financial decisions through comprehensive analysis and
 
 import os
 import asyncio
-import math
-import statistics
 import numpy as np
-import requests
-import json
-from typing import Dict, Any, List, Union
-from datetime import datetime, timedelta
-from orion.agent_core import create_orchestrator, build_async_agent
-from orion.agent_core.utils import function_to_schema
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, Tuple, Union
+from orion.agent_core import create_orchestrator
 from orion.graph_core import WorkflowGraph
 from orion.tool_registry import tool
+from ._common import WorkflowPrototypes, cached_schema
+from ._finance_kernels import annuity_fv, monthly_payment as amortized_payment
+
+
+# Assumed annual inflation rate, in percent
+ASSUMED_INFLATION_RATE = 3.5
+
+# Retirement planning assumptions: life expectancy (years of age) and the 4% safe withdrawal rule
+LIFE_EXPECTANCY = 85
+SAFE_WITHDRAWAL_RATE = 0.04
+
+# Risk score (1-10 scale) per risk level; unrecognised levels score 0
+_RISK_WEIGHTS = MappingProxyType({'low': 2, 'medium': 5, 'high': 8, 'very_high': 10})
 
 
 # Financial Analysis Tools
@@ -51,25 +59,29 @@ def calculate_investment_returns(principal: float, annual_rate: float, years: in
         19671.51
     """
     try:
-        # Compound interest formula: A = P(1 + r/n)^(nt)
-        amount = principal * (1 + annual_rate / compound_frequency) ** (compound_frequency * years)
+        # Compound interest formula: A = P(1 + r/n)^(nt) = P * step^t with step = (1 + r/n)^n,
+        # which holds for fractional t too
+        inv_frequency = 1.0 / compound_frequency
+        step = (1 + annual_rate * inv_frequency) ** compound_frequency
+        amount = principal * step ** years
         total_return = amount - principal
         roi_percentage = (total_return / principal) * 100
+
+        # Calculate year-by-year growth over the completed years. Every year multiplies the
+        # balance by the same step, so the whole curve is a running product.
+        years_arr = np.arange(1, int(years) + 1)
+        vals = principal * np.cumprod(np.full(years_arr.shape, step))
+        gains = vals - principal
+        # Python's round() on the exact doubles, not np.round, which scales by 100 first and
+        # can flip half-cent cases (10700.535 -> 10700.54)
+        yearly_values = [
+            {"year": year, "value": round(value, 2), "gain": round(gain, 2)}
+            for year, value, gain in zip(years_arr.tolist(), vals.tolist(), gains.tolist())
+        ]
         
-        # Calculate year-by-year growth
-        yearly_values = []
-        for year in range(1, years + 1):
-            yearly_amount = principal * (1 + annual_rate / compound_frequency) ** (compound_frequency * year)
-            yearly_values.append({
-                "year": year,
-                "value": round(yearly_amount, 2),
-                "gain": round(yearly_amount - principal, 2)
-            })
-        
-        # Assume 3.5% inflation rate
-        inflation_rate = 3.5
+        inflation_rate = ASSUMED_INFLATION_RATE
         real_annual_rate = ((1 + annual_rate) / (1 + inflation_rate/100)) - 1
-        real_amount = principal * (1 + real_annual_rate / compound_frequency) ** (compound_frequency * years)
+        real_amount = principal * (1 + real_annual_rate * inv_frequency) ** (compound_frequency * years)
         real_return = real_amount - principal
         
         return {
@@ -96,6 +108,70 @@ def calculate_investment_returns(principal: float, annual_rate: float, years: in
         return {"error": f"Investment calculation error: {str(e)}"}
 
 
+def iter_yearly_progression(principal: float, annual_rate: float, years: int, compound_frequency: int = 12) -> Iterator[Dict[str, float]]:
+    """
+    Lazily yield the ``yearly_progression`` entries of ``calculate_investment_returns``.
+
+    Each year is derived from the previous one with a single multiplication, so long horizons
+    (e.g. Monte Carlo retirement runs) can be streamed in O(1) memory instead of materializing
+    the whole list. The growth factor is accumulated and rounded exactly like the tool's
+    ``cumprod``, so both produce identical entries.
+
+    Example:
+        >>> next(iter_yearly_progression(10000, 0.07, 10))
+        {'year': 1, 'value': 10722.9, 'gain': 722.9}
+    """
+    step = (1 + annual_rate * (1.0 / compound_frequency)) ** compound_frequency
+    growth = 1.0
+    for year in range(1, int(years) + 1):
+        growth *= step
+        value = principal * growth
+        yield {"year": year, "value": round(value, 2), "gain": round(value - principal, 2)}
+
+
+def calculate_investment_returns_batch(principal, annual_rate, years, compound_frequency=12) -> Dict[str, np.ndarray]:
+    """
+    Vectorized companion to ``calculate_investment_returns`` for parameter sweeps.
+
+    All arguments accept scalars or array-likes and are broadcast against each other, so a grid of
+    principals, rates and horizons is evaluated in a handful of NumPy operations instead of one
+    Python call per combination. Only the headline figures are returned (no yearly progression).
+
+    Returns:
+        Dict[str, np.ndarray]: Broadcast arrays for ``final_amount``, ``total_return``,
+        ``roi_percentage``, ``real_annual_return`` and ``inflation_adjusted_amount``.
+
+    Example:
+        >>> sweep = calculate_investment_returns_batch(10000, [0.03, 0.05, 0.07], 10)
+        >>> sweep['final_amount'].round(2)
+        array([13493.54, 16470.09, 20096.61])
+    """
+    principal, annual_rate, years, compound_frequency = np.broadcast_arrays(
+        np.asarray(principal, dtype=np.float64),
+        np.asarray(annual_rate, dtype=np.float64),
+        np.asarray(years, dtype=np.float64),
+        np.asarray(compound_frequency, dtype=np.float64),
+    )
+    periods = compound_frequency * years
+    inv_frequency = 1.0 / compound_frequency
+
+    amount = principal * (1 + annual_rate * inv_frequency) ** periods
+    total_return = amount - principal
+    real_annual_rate = (1 + annual_rate) / (1 + ASSUMED_INFLATION_RATE / 100) - 1
+    real_amount = principal * (1 + real_annual_rate * inv_frequency) ** periods
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi_percentage = total_return / principal * 100
+
+    return {
+        "final_amount": amount,
+        "total_return": total_return,
+        "roi_percentage": roi_percentage,
+        "real_annual_return": real_annual_rate * 100,
+        "inflation_adjusted_amount": real_amount,
+    }
+
+
 @tool
 def analyze_portfolio_risk(investments: List[Dict[str, Union[str, float]]], total_portfolio_value: float) -> Dict[str, Any]:
     """
@@ -133,8 +209,11 @@ def analyze_portfolio_risk(investments: List[Dict[str, Union[str, float]]], tota
         if not investments:
             return {"error": "No investments provided for analysis"}
         
-        # Calculate portfolio weights
+        # Single pass over the holdings: weights, allocated total and both distributions.
+        # Distributions sum the rounded weights, keyed by the labels exactly as given.
         portfolio_analysis = []
+        risk_distribution: Dict[Any, float] = {}
+        asset_distribution: Dict[Any, float] = {}
         total_allocated = 0
         
         for investment in investments:
@@ -142,31 +221,22 @@ def analyze_portfolio_risk(investments: List[Dict[str, Union[str, float]]], tota
             asset_type = investment.get('type', 'unknown')
             risk_level = investment.get('risk_level', 'medium')
             
-            weight = (amount / total_portfolio_value) * 100
+            weight = round((amount / total_portfolio_value) * 100, 2)
             total_allocated += amount
+            risk_distribution[risk_level] = risk_distribution.get(risk_level, 0) + weight
+            asset_distribution[asset_type] = asset_distribution.get(asset_type, 0) + weight
             
             portfolio_analysis.append({
                 "asset": investment.get('name', 'Unknown'),
                 "type": asset_type,
                 "amount": amount,
-                "weight_percentage": round(weight, 2),
+                "weight_percentage": weight,
                 "risk_level": risk_level
             })
         
-        # Risk assessment
-        risk_distribution = {}
-        asset_distribution = {}
-        
-        for investment in portfolio_analysis:
-            risk = investment['risk_level']
-            asset_type = investment['type']
-            
-            risk_distribution[risk] = risk_distribution.get(risk, 0) + investment['weight_percentage']
-            asset_distribution[asset_type] = asset_distribution.get(asset_type, 0) + investment['weight_percentage']
-        
         # Generate risk score (1-10, 10 being highest risk)
-        risk_weights = {'low': 2, 'medium': 5, 'high': 8, 'very_high': 10}
-        weighted_risk = sum(risk_distribution.get(risk, 0) * weight / 100 for risk, weight in risk_weights.items())
+        # Scored per distinct risk level from the grouped totals, not per investment
+        weighted_risk = sum(risk_distribution.get(risk, 0) * weight / 100 for risk, weight in _RISK_WEIGHTS.items())
         
         # Diversification score (higher is better)
         num_asset_types = len(asset_distribution)
@@ -241,11 +311,7 @@ def calculate_loan_affordability(annual_income: float, monthly_expenses: float,
         monthly_rate = interest_rate / 12
         num_payments = loan_term_years * 12
         
-        if monthly_rate == 0:
-            monthly_payment = loan_amount / num_payments
-        else:
-            monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate)**num_payments) / \
-                            ((1 + monthly_rate)**num_payments - 1)
+        monthly_payment = amortized_payment(float(loan_amount), float(monthly_rate), float(num_payments))
         
         # Affordability analysis
         debt_to_income_ratio = (monthly_payment / monthly_income) * 100
@@ -327,7 +393,7 @@ def retirement_planning_analysis(current_age: int, retirement_age: int, current_
     """
     try:
         years_to_retirement = retirement_age - current_age
-        years_in_retirement = 85 - retirement_age  # Assuming life expectancy of 85
+        years_in_retirement = LIFE_EXPECTANCY - retirement_age
         
         if years_to_retirement <= 0:
             return {"error": "Already at or past retirement age"}
@@ -339,16 +405,14 @@ def retirement_planning_analysis(current_age: int, retirement_age: int, current_
         monthly_rate = expected_return / 12
         months_to_retirement = years_to_retirement * 12
         
-        if monthly_rate == 0:
-            future_value_contributions = monthly_contribution * months_to_retirement
-        else:
-            future_value_contributions = monthly_contribution * \
-                (((1 + monthly_rate) ** months_to_retirement - 1) / monthly_rate)
+        # Future value of $1/month; shared by the contribution projection and the back-solve below
+        annuity_factor = annuity_fv(1.0, float(monthly_rate), float(months_to_retirement))
+        future_value_contributions = monthly_contribution * annuity_factor
         
         total_retirement_savings = future_value_current + future_value_contributions
         
         # Calculate sustainable withdrawal amount (4% rule)
-        safe_withdrawal_rate = 0.04
+        safe_withdrawal_rate = SAFE_WITHDRAWAL_RATE
         sustainable_annual_income = total_retirement_savings * safe_withdrawal_rate
         sustainable_monthly_income = sustainable_annual_income / 12
         
@@ -359,9 +423,7 @@ def retirement_planning_analysis(current_age: int, retirement_age: int, current_
         # Calculate additional savings needed
         if income_gap > 0:
             additional_capital_needed = income_gap / safe_withdrawal_rate
-            additional_monthly_savings = additional_capital_needed / \
-                (((1 + monthly_rate) ** months_to_retirement - 1) / monthly_rate) if monthly_rate != 0 else \
-                additional_capital_needed / months_to_retirement
+            additional_monthly_savings = additional_capital_needed / annuity_factor
         else:
             additional_capital_needed = 0
             additional_monthly_savings = 0
@@ -409,36 +471,140 @@ def retirement_planning_analysis(current_age: int, retirement_age: int, current_
         return {"error": f"Retirement planning error: {str(e)}"}
 
 
+def retirement_planning_analysis_batch(current_age, retirement_age, current_savings, monthly_contribution,
+                                      expected_return, desired_retirement_income) -> Dict[str, np.ndarray]:
+    """
+    Vectorized companion to ``retirement_planning_analysis`` for multi-scenario sweeps.
+
+    All arguments accept scalars or array-likes and are broadcast against each other, so N what-if
+    scenarios cost a fixed number of NumPy operations instead of N tool calls. Scenarios that are
+    already at or past retirement age yield NaN.
+
+    Returns:
+        Dict[str, np.ndarray]: Broadcast arrays for ``years_to_retirement``,
+        ``future_value_of_current_savings``, ``future_value_of_contributions``,
+        ``total_projected_savings``, ``sustainable_monthly_income``, ``monthly_income_gap``,
+        ``additional_capital_needed``, ``additional_monthly_savings_required`` and
+        ``income_sufficient`` (bool).
+
+    Example:
+        >>> sweep = retirement_planning_analysis_batch(35, 65, 50000, 500, [0.05, 0.07], 5000)
+        >>> sweep['income_sufficient']
+        array([False, False])
+    """
+    current_age, retirement_age, current_savings, monthly_contribution, expected_return, desired_retirement_income = \
+        np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in (
+            current_age, retirement_age, current_savings, monthly_contribution, expected_return, desired_retirement_income
+        )))
+
+    years_to_retirement = retirement_age - current_age
+    valid = years_to_retirement > 0
+    monthly_rate = expected_return / 12
+    months_to_retirement = years_to_retirement * 12
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity_factor = np.where(
+            monthly_rate == 0,
+            months_to_retirement,
+            np.expm1(months_to_retirement * np.log1p(monthly_rate)) / monthly_rate
+        )
+        future_value_current = current_savings * (1 + expected_return) ** years_to_retirement
+        future_value_contributions = monthly_contribution * annuity_factor
+        total_retirement_savings = future_value_current + future_value_contributions
+
+        sustainable_annual_income = total_retirement_savings * SAFE_WITHDRAWAL_RATE
+        income_gap = desired_retirement_income * 12 - sustainable_annual_income
+        additional_capital_needed = np.maximum(income_gap, 0) / SAFE_WITHDRAWAL_RATE
+        additional_monthly_savings = additional_capital_needed / annuity_factor
+
+    def masked(values: np.ndarray) -> np.ndarray:
+        return np.where(valid, values, np.nan)
+
+    return {
+        "years_to_retirement": years_to_retirement,
+        "future_value_of_current_savings": masked(future_value_current),
+        "future_value_of_contributions": masked(future_value_contributions),
+        "total_projected_savings": masked(total_retirement_savings),
+        "sustainable_monthly_income": masked(sustainable_annual_income / 12),
+        "monthly_income_gap": masked(income_gap / 12),
+        "additional_capital_needed": masked(additional_capital_needed),
+        "additional_monthly_savings_required": masked(additional_monthly_savings),
+        "income_sufficient": valid & (income_gap <= 0),
+    }
+
+
 class FinancialAnalysisAgent:
     """Real-world financial analysis agent for investment planning and financial decision making."""
     
+    # Built once at import; read-only so callers cannot mutate the shared scenarios
+    _SCENARIOS: Tuple[Mapping[str, Any], ...] = (
+        MappingProxyType({
+            "scenario": "Young professional retirement planning",
+            "prompt": "I'm 25 years old, make $75,000/year, have $10,000 saved, can save $500/month. I want to retire at 65 with $5,000/month income. What's my retirement plan?",
+            "category": "retirement_planning"
+        }),
+        MappingProxyType({
+            "scenario": "Investment portfolio analysis",
+            "prompt": "Analyze my $100,000 portfolio: $40,000 in tech stocks (high risk), $30,000 in bonds (low risk), $20,000 in real estate (medium risk), $10,000 in cash. What's my risk profile?",
+            "category": "portfolio_analysis"
+        }),
+        MappingProxyType({
+            "scenario": "Home loan affordability",
+            "prompt": "I earn $80,000/year, have $3,000 monthly expenses, want a $300,000 mortgage at 6.5% for 30 years. Can I afford this?",
+            "category": "loan_analysis"
+        }),
+        MappingProxyType({
+            "scenario": "Investment return calculation",
+            "prompt": "If I invest $50,000 at 7% annual return for 20 years with monthly compounding, what will it be worth?",
+            "category": "investment_calculation"
+        })
+    )
+    
+    # Workflow prototypes shared by all instances, built on first use
+    _workflows = WorkflowPrototypes()
+    
     def __init__(self):
         self.name = "FinancialAnalysisAgent"
         self.complexity_level = 1
         self.description = "Real-world financial planning agent for investment analysis, retirement planning, and loan affordability"
+        
+        # LLM endpoint settings, read once; workflows are built and shared per endpoint
+        self._api_key = os.environ.get("API_KEY", "")
+        self._base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
+        if not self._api_key:
+            raise ValueError("API_KEY environment variable is required")
     
     async def create_workflow(self) -> WorkflowGraph:
-        """Create the financial analysis workflow."""
+        """Create the financial analysis workflow (a private copy of the shared prototype)."""
+        return await self._workflows.copy(self._workflow_key(), self._build_workflow)
+    
+    async def warmup(self) -> None:
+        """Build the shared workflow prototype (tool schemas, orchestrator) ahead of the first request."""
+        await self._workflows.warmup(self._workflow_key(), self._build_workflow)
+    
+    def _workflow_key(self) -> Tuple[Any, ...]:
+        return (type(self), self._api_key, self._base_url)
+    
+    async def _build_workflow(self) -> WorkflowGraph:
+        """Build the financial analysis workflow graph."""
         try:
-            api_key = os.environ.get("API_KEY", "")
-            base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
-            
-            if not api_key:
-                raise ValueError("API_KEY environment variable is required")
+            api_key = self._api_key
+            base_url = self._base_url
             
             # Create workflow graph
             workflow = WorkflowGraph()
             
             # Create tool schemas for orchestrator
-            tools = [
-                await function_to_schema(calculate_investment_returns, func_name="calculate_investment_returns", enhance_description=True),
-                await function_to_schema(analyze_portfolio_risk, func_name="analyze_portfolio_risk", enhance_description=True),
-                await function_to_schema(calculate_loan_affordability, func_name="calculate_loan_affordability", enhance_description=True),
-                await function_to_schema(retirement_planning_analysis, func_name="retirement_planning_analysis", enhance_description=True),
-            ]
+            tools = list(await asyncio.gather(
+                cached_schema(calculate_investment_returns, func_name="calculate_investment_returns", enhance_description=True),
+                cached_schema(analyze_portfolio_risk, func_name="analyze_portfolio_risk", enhance_description=True),
+                cached_schema(calculate_loan_affordability, func_name="calculate_loan_affordability", enhance_description=True),
+                cached_schema(retirement_planning_analysis, func_name="retirement_planning_analysis", enhance_description=True),
+            ))
             
             # Create orchestrator agent
-            orchestrator_agent = create_orchestrator(
+            orchestrator_agent = await asyncio.to_thread(
+                create_orchestrator,
                 api_key=api_key,
                 base_url=base_url,
                 llm_model="gpt-4",
@@ -473,30 +639,46 @@ class FinancialAnalysisAgent:
             print(f"Error creating workflow: {e}")
             raise
     
-    def get_real_world_scenarios(self) -> List[Dict[str, Any]]:
+    def get_real_world_scenarios(self) -> Tuple[Mapping[str, Any], ...]:
         """Get real-world financial scenarios for testing."""
-        return [
-            {
-                "scenario": "Young professional retirement planning",
-                "prompt": "I'm 25 years old, make $75,000/year, have $10,000 saved, can save $500/month. I want to retire at 65 with $5,000/month income. What's my retirement plan?",
-                "category": "retirement_planning"
-            },
-            {
-                "scenario": "Investment portfolio analysis",
-                "prompt": "Analyze my $100,000 portfolio: $40,000 in tech stocks (high risk), $30,000 in bonds (low risk), $20,000 in real estate (medium risk), $10,000 in cash. What's my risk profile?",
-                "category": "portfolio_analysis"
-            },
-            {
-                "scenario": "Home loan affordability",
-                "prompt": "I earn $80,000/year, have $3,000 monthly expenses, want a $300,000 mortgage at 6.5% for 30 years. Can I afford this?",
-                "category": "loan_analysis"
-            },
-            {
-                "scenario": "Investment return calculation",
-                "prompt": "If I invest $50,000 at 7% annual return for 20 years with monthly compounding, what will it be worth?",
-                "category": "investment_calculation"
+        return self._SCENARIOS
+    
+    async def solve_financial_problem(self, scenario: str) -> Dict[str, Any]:
+        """Solve a real-world financial planning problem."""
+        try:
+            # Compiled per scenario: a CompiledGraph accumulates execution memory across runs
+            workflow = await self.create_workflow()
+            compiled_graph = workflow.compile()
+            
+            result = await compiled_graph.execute(initial_input=scenario)
+            
+            return {
+                "agent": self.name,
+                "scenario": scenario,
+                "analysis": result,
+                "status": "success"
             }
-        ]
+        except Exception as e:
+            return {
+                "agent": self.name,
+                "scenario": scenario,
+                "error": str(e),
+                "status": "error"
+            }
+    
+    async def solve_all_scenarios(self, concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Solve every real-world scenario concurrently, at most ``concurrency`` at a time."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def solve(scenario: Mapping[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.solve_financial_problem(scenario["prompt"])
+        
+        await self.warmup()
+        return list(await asyncio.gather(*(solve(scenario) for scenario in self.get_real_world_scenarios())))
 
 
 # Export the agent
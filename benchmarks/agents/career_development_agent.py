@@ -3,22 +3,583 @@ Career Development Agent - Real-world career planning and job search assistance
 Provides comprehensive career guidance, job search support, and professional development planning.
 """
 
+import asyncio
+import atexit
+import logging
 import os
-import requests
 import re
-from typing import Dict, Any, List
-from datetime import datetime
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+from datetime import date
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+import httpx
+import numpy as np
 from orion.agent_core import create_orchestrator, build_async_agent
-from orion.agent_core.utils import function_to_schema
 from orion.graph_core import WorkflowGraph
 from orion.tool_registry import tool
 
+from ._common import WorkflowPrototypes, cached_schema, thaw
+from ._career_kernels import salary_stats
+
 
 
 from dotenv import load_dotenv
 
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    import diskcache
+except ImportError:  # diskcache is optional
+    diskcache = None
+
+try:
+    import platformdirs
+except ImportError:  # platformdirs is optional
+    platformdirs = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Real job search API (JSearch/RapidAPI for Indeed/LinkedIn data); the key is read once at import
+_RAPIDAPI_HEADERS = MappingProxyType({
+    'X-RapidAPI-Key': os.environ.get('RAPIDAPI_KEY', ''),
+    'X-RapidAPI-Host': 'jsearch.p.rapidapi.com'
+})
+if not _RAPIDAPI_HEADERS['X-RapidAPI-Key']:
+    logger.warning("RAPIDAPI_KEY is not set; job market analysis will report the API as unavailable")
+
+# Shared keep-alive client so repeat API calls skip the TCP/TLS handshake
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+)
+atexit.register(_HTTP.close)
+
+# JSearch responses memoized per normalized query; postings change slowly so an hour is fresh enough
+_JOB_CACHE_TTL = 3600.0
+_JOB_CACHE_MAXSIZE = 512
+_job_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_job_cache_lock = threading.Lock()
+
+# Second tier on disk so a restarted process does not refetch the same queries for a day.
+# Entries are pickled, so the cache lives in a per-user directory only its owner can access;
+# it is opened on first use rather than at import.
+_JOB_DISK_CACHE_TTL = 24 * 3600
+_job_disk_cache: Optional["diskcache.Cache"] = None
+_job_disk_cache_opened = False
+_job_disk_cache_lock = threading.Lock()
+
+
+def _job_disk_cache_dir() -> str:
+    """ORION_JOB_CACHE_DIR if set, else the user's cache directory."""
+    configured = os.environ.get('ORION_JOB_CACHE_DIR')
+    if configured:
+        return configured
+    if platformdirs is not None:
+        return os.path.join(platformdirs.user_cache_dir('orion'), 'jobcache')
+    return os.path.join(os.path.expanduser('~'), '.cache', 'orion', 'jobcache')
+
+
+def _get_job_disk_cache() -> Optional["diskcache.Cache"]:
+    """Return the on-disk job cache, opening it on first use; None if it is unavailable."""
+    global _job_disk_cache, _job_disk_cache_opened
+    if _job_disk_cache_opened:
+        return _job_disk_cache
+    with _job_disk_cache_lock:
+        if not _job_disk_cache_opened:
+            if diskcache is not None:
+                path = _job_disk_cache_dir()
+                try:
+                    os.makedirs(path, mode=0o700, exist_ok=True)
+                    os.chmod(path, 0o700)  # makedirs leaves an existing directory's mode alone
+                    _job_disk_cache = diskcache.Cache(path, size_limit=2 ** 30)
+                except OSError as e:
+                    logger.warning("Job disk cache disabled, cannot use %s: %s", path, e)
+                else:
+                    atexit.register(_job_disk_cache.close)
+            _job_disk_cache_opened = True
+    return _job_disk_cache
+
+
+def _fetch_jobs(job_title: str, location: str, experience_level: str) -> List[Dict[str, Any]]:
+    """Fetch job postings from JSearch, reusing a cached response for repeat queries."""
+    key = (job_title.lower().strip(), location.lower().strip(), experience_level.lower())
+    now = time.monotonic()
+    with _job_cache_lock:
+        cached = _job_cache.get(key)
+        if cached is not None and now - cached[0] < _JOB_CACHE_TTL:
+            _job_cache.move_to_end(key)
+            return cached[1]
+
+    disk_cache = _get_job_disk_cache()
+    jobs = disk_cache.get(key) if disk_cache is not None else None
+    if jobs is not None:
+        _remember_jobs(key, now, jobs)
+        return jobs
+
+    # Without a key every request is rejected, so skip the round-trip
+    if not _RAPIDAPI_HEADERS['X-RapidAPI-Key']:
+        return []
+
+    # Real API call to JSearch
+    url = "https://jsearch.p.rapidapi.com/search"
+    params = {
+        'query': f"{job_title} {experience_level}",
+        'page': '1',
+        'num_pages': '3',
+        'date_posted': 'month',
+        'remote_jobs_only': 'false',
+        'employment_types': 'FULLTIME',
+        'job_requirements': experience_level,
+        'country': 'US'
+    }
+
+    if location.lower() != 'remote':
+        params['query'] += f" {location}"
+
+    try:
+        response = _HTTP.get(url, headers=_RAPIDAPI_HEADERS, params=params)
+        if response.status_code != 200:
+            return []
+        payload = _json_loads(response.content)
+    except (httpx.HTTPError, ValueError):  # transport failure or malformed JSON
+        return []
+    jobs = payload.get('data', []) if isinstance(payload, dict) else []
+
+    # Only successful responses are cached so a transient API failure is retried next call
+    _remember_jobs(key, now, jobs)
+    if disk_cache is not None:
+        disk_cache.set(key, jobs, expire=_JOB_DISK_CACHE_TTL)
+    return jobs
+
+
+def _remember_jobs(key: Tuple[str, str, str], now: float, jobs: List[Dict[str, Any]]) -> None:
+    with _job_cache_lock:
+        _job_cache[key] = (now, jobs)
+        if len(_job_cache) > _JOB_CACHE_MAXSIZE:
+            _job_cache.popitem(last=False)
+
+
+# Resume skill vocabulary. Single-word skills are matched by intersecting the
+# text's word set; the few multi-word skills use one word-bounded regex.
+_RESUME_SKILL_WORDS = frozenset({
+    'python', 'java', 'javascript', 'sql', 'aws', 'azure', 'docker', 'kubernetes', 'react', 'angular', 'vue',
+    'ai', 'analytics', 'visualization',
+    'agile', 'scrum', 'leadership', 'communication',
+    'bachelor', 'master', 'degree', 'certification', 'experience'
+})
+_RESUME_SKILL_PHRASE_RE = re.compile(r'\b(machine learning|data science|project management)\b')
+_WORD_RE = re.compile(r'\w+')
+
+
+def _extract_resume_skills(text: str) -> set:
+    skills = set(_WORD_RE.findall(text))
+    skills &= _RESUME_SKILL_WORDS
+    skills.update(_RESUME_SKILL_PHRASE_RE.findall(text))
+    return skills
+
+# Literal keywords the tools look for in lower-cased text. They are all matched as
+# plain substrings, so one multi-pattern pass (Hyperscan, else Aho-Corasick) finds
+# every category at once.
+_COMMON_SKILLS = ('python', 'javascript', 'sql', 'aws', 'react', 'java', 'docker', 'kubernetes', 'machine learning', 'ai')
+_STRONG_VERBS = ('achieved', 'implemented', 'led', 'developed', 'created', 'improved', 'managed', 'delivered')
+_WEAK_VERBS = ('responsible for', 'worked on', 'helped with', 'participated in')
+_SECTION_KEYWORDS = MappingProxyType({
+    'contact_info': ('email', 'phone', 'linkedin'),
+    'summary': ('summary', 'objective', 'profile'),
+    'experience': ('experience', 'work', 'employment'),
+    'education': ('education', 'degree', 'university'),
+    'skills': ('skills', 'technologies', 'proficient')
+})
+
+
+def _build_keyword_tags() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    tags: Dict[str, List[Tuple[str, str]]] = {}
+    for skill in _COMMON_SKILLS:
+        tags.setdefault(skill, []).append(('job_skill', skill))
+    for verb in _STRONG_VERBS:
+        tags.setdefault(verb, []).append(('strong_verb', verb))
+    for verb in _WEAK_VERBS:
+        tags.setdefault(verb, []).append(('weak_verb', verb))
+    for section, keywords in _SECTION_KEYWORDS.items():
+        for keyword in keywords:
+            tags.setdefault(keyword, []).append(('section', section))
+    return {keyword: tuple(entries) for keyword, entries in tags.items()}
+
+
+_KEYWORD_TAGS = _build_keyword_tags()
+
+_KEYWORD_LIST = tuple(_KEYWORD_TAGS)
+
+_KeywordTags = Tuple[Tuple[str, str], ...]
+
+
+def _substring_keywords(text: str) -> Iterator[_KeywordTags]:
+    return (tags for keyword, tags in _KEYWORD_TAGS.items() if keyword in text)
+
+
+# Keyword matchers by backend, fastest first; all of them report the same hits
+_KEYWORD_BACKENDS: Dict[str, Callable[[str], Iterable[_KeywordTags]]] = {}
+
+if hyperscan is not None:
+    # SINGLEMATCH reports each keyword at most once, which is all the tools need
+    _KEYWORD_DB = hyperscan.Database()
+    _KEYWORD_DB.compile(
+        expressions=[re.escape(keyword).encode() for keyword in _KEYWORD_LIST],
+        ids=list(range(len(_KEYWORD_LIST))),
+        elements=len(_KEYWORD_LIST),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_KEYWORD_LIST)
+    )
+    # Scratch space cannot be shared by concurrent scans, so each thread gets its own
+    _keyword_scratch = threading.local()
+
+    def _hyperscan_keywords(text: str) -> List[_KeywordTags]:
+        scratch = getattr(_keyword_scratch, 'scratch', None)
+        if scratch is None:
+            scratch = _keyword_scratch.scratch = hyperscan.Scratch(_KEYWORD_DB)
+
+        matched: List[_KeywordTags] = []
+
+        def on_match(keyword_id, start, end, flags, context):
+            matched.append(_KEYWORD_TAGS[_KEYWORD_LIST[keyword_id]])
+
+        # Keywords are ASCII, so substring hits in UTF-8 bytes are hits in the text
+        _KEYWORD_DB.scan(text.encode(), match_event_handler=on_match, scratch=scratch)
+        return matched
+
+    _KEYWORD_BACKENDS['hyperscan'] = _hyperscan_keywords
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _tags in _KEYWORD_TAGS.items():
+        _KEYWORD_AUTOMATON.add_word(_keyword, _tags)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+    def _ahocorasick_keywords(text: str) -> Iterator[_KeywordTags]:
+        return (tags for _, tags in _KEYWORD_AUTOMATON.iter(text))
+
+    _KEYWORD_BACKENDS['aho-corasick'] = _ahocorasick_keywords
+
+_KEYWORD_BACKENDS['substring'] = _substring_keywords
+# Matcher used by _scan_keywords: the fastest one available
+_keyword_hits = next(iter(_KEYWORD_BACKENDS.values()))
+
+
+def _scan_keywords(text: str) -> Dict[str, set]:
+    """Find every tracked keyword in ``text``, grouped by category."""
+    found: Dict[str, set] = {'job_skill': set(), 'strong_verb': set(), 'weak_verb': set(), 'section': set()}
+    for tags in _keyword_hits(text):
+        for category, value in tags:
+            found[category].add(value)
+    return found
+
+
+@lru_cache(maxsize=1)
+def _format_day(day_ordinal: int) -> str:
+    return date.fromordinal(day_ordinal).isoformat()
+
+
+def _today() -> str:
+    """Today's date as YYYY-MM-DD, formatted once per day."""
+    return _format_day(date.today().toordinal())
+
+
+def _keyword_pattern(keywords) -> "re.Pattern[str]":
+    # Zero-width lookahead reports overlapping keywords too, so the result matches
+    # testing each keyword with a plain substring check
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+
+def _best_keyword(pattern: "re.Pattern[str]", rank: Dict[str, int], text: str) -> Optional[str]:
+    """Return the highest-priority (lowest rank) keyword found in ``text``, or None."""
+    return min(pattern.findall(text), key=rank.__getitem__, default=None)
+
+
+# Base salary and yearly raise by title keyword; earlier entries take precedence
+_SALARY_BANDS = MappingProxyType({
+    'senior': (85000, 3000),
+    'lead': (120000, 5000),
+    'principal': (120000, 5000),
+    'manager': (95000, 4000)
+})
+_DEFAULT_SALARY_BAND = (55000, 4000)
+_SALARY_TITLE_RANK = MappingProxyType({'senior': 0, 'lead': 1, 'principal': 1, 'manager': 2})
+_SALARY_TITLE_RE = _keyword_pattern(_SALARY_TITLE_RANK)
+
+# Cost-of-living salary multipliers (realistic), keyed by lower-case city
+_LOCATION_MULTIPLIERS = MappingProxyType({
+    'san francisco': 1.4, 'new york': 1.3, 'seattle': 1.25,
+    'boston': 1.2, 'los angeles': 1.15, 'chicago': 1.1,
+    'austin': 1.05, 'denver': 1.0, 'atlanta': 0.95,
+    'remote': 1.1
+})
+_LOCATION_RANK = MappingProxyType({city: rank for rank, city in enumerate(_LOCATION_MULTIPLIERS)})
+_LOCATION_RE = _keyword_pattern(_LOCATION_MULTIPLIERS)
+
+# Generic ATS advice returned with every resume analysis
+_ATS_TIPS = (
+    "Use standard section headers",
+    "Include relevant keywords naturally",
+    "Use consistent formatting",
+    "Avoid graphics and tables"
+)
+
+
+# Interview preparation content shared by every call; only company-specific lines are built per call
+_TECH_COMPANY_KEYWORDS = ('tech', 'software', 'data', 'ai')
+_COMPANY_VALUES = ("Innovation", "Collaboration", "Customer Focus", "Integrity")
+_BEHAVIORAL_QUESTIONS = (
+    "Tell me about a time when you had to overcome a significant challenge at work.",
+    "Describe a situation where you had to work with a difficult team member.",
+    "Give me an example of when you had to learn something new quickly.",
+    "Tell me about a project you're particularly proud of.",
+    "Describe a time when you had to make a decision with incomplete information."
+)
+_ENGINEERING_QUESTIONS = (
+    "Walk me through your approach to debugging a complex issue.",
+    "How do you ensure code quality in your projects?",
+    "Describe your experience with [relevant technology stack].",
+    "How do you handle technical debt in legacy systems?",
+    "What's your process for learning new technologies?"
+)
+_MANAGEMENT_QUESTIONS = (
+    "How do you handle underperforming team members?",
+    "Describe your approach to project planning and resource allocation.",
+    "How do you balance technical debt with feature development?",
+    "What's your strategy for building and maintaining team culture?",
+    "How do you handle conflicting priorities from stakeholders?"
+)
+_ANALYST_QUESTIONS = (
+    "Walk me through your approach to analyzing a new dataset.",
+    "How do you ensure data quality and accuracy?",
+    "Describe a time when your analysis led to a business decision.",
+    "What tools and methods do you use for data visualization?",
+    "How do you communicate technical findings to non-technical stakeholders?"
+)
+_RESEARCH_STEPS = (
+    "Review the job description and requirements",
+    "Research the interviewer(s) on LinkedIn",
+    "Prepare specific examples using STAR method",
+    "Practice common technical concepts"
+)
+_QUESTIONS_TO_ASK = (
+    "What does success look like in this role?",
+    "What are the biggest challenges facing the team right now?",
+    "How do you measure performance in this position?",
+    "What opportunities are there for professional development?",
+    "Can you tell me about the team I'd be working with?"
+)
+_ONSITE_ADVICE = (
+    (
+        "Plan your route and arrive 10-15 minutes early",
+        "Bring multiple copies of your resume",
+        "Prepare for multiple rounds of interviews",
+        "Dress professionally and appropriately for company culture",
+        "Bring a notebook and pen for taking notes"
+    ),
+    "2-4 hours with multiple interviews"
+)
+# interview type -> (preparation steps, typical duration)
+_INTERVIEW_TYPE_ADVICE = MappingProxyType({
+    "phone": (
+        (
+            "Test your phone connection and find a quiet space",
+            "Have your resume and notes readily available",
+            "Stand or sit up straight to project confidence",
+            "Speak clearly and at a moderate pace"
+        ),
+        "30-45 minutes typically"
+    ),
+    "video": (
+        (
+            "Test your camera and microphone beforehand",
+            "Ensure good lighting (face the light source)",
+            "Choose a professional, uncluttered background",
+            "Dress professionally from head to toe",
+            "Make eye contact with the camera, not the screen"
+        ),
+        "45-60 minutes typically"
+    ),
+    "onsite": _ONSITE_ADVICE,
+    "in-person": _ONSITE_ADVICE
+})
+_SUCCESS_TIPS = (
+    "Be authentic and show genuine enthusiasm",
+    "Demonstrate problem-solving skills with specific examples",
+    "Ask thoughtful questions about the role and company",
+    "Follow up with a thank-you email within 24 hours",
+    "Be prepared to discuss your career goals and motivations"
+)
+
+# Title keyword -> technical question bank; earlier groups take precedence
+_INTERVIEW_TRACK_QUESTIONS = MappingProxyType({
+    'engineer': _ENGINEERING_QUESTIONS, 'developer': _ENGINEERING_QUESTIONS,
+    'manager': _MANAGEMENT_QUESTIONS, 'lead': _MANAGEMENT_QUESTIONS,
+    'analyst': _ANALYST_QUESTIONS, 'data': _ANALYST_QUESTIONS
+})
+_INTERVIEW_TRACK_RANK = MappingProxyType({'engineer': 0, 'developer': 0, 'manager': 1, 'lead': 1, 'analyst': 2, 'data': 2})
+_INTERVIEW_TRACK_RE = _keyword_pattern(_INTERVIEW_TRACK_RANK)
+
+
+# Career progression maps: track -> level -> example roles
+_CAREER_PATHS = MappingProxyType({
+    "software_engineer": MappingProxyType({
+        "junior": ("Software Engineer", "Junior Developer"),
+        "mid": ("Software Engineer II", "Full Stack Developer"),
+        "senior": ("Senior Software Engineer", "Tech Lead"),
+        "lead": ("Principal Engineer", "Engineering Manager", "Architect"),
+        "executive": ("VP Engineering", "CTO", "Chief Architect")
+    }),
+    "data_analyst": MappingProxyType({
+        "junior": ("Data Analyst", "Junior Analyst"),
+        "mid": ("Data Analyst II", "Business Analyst"),
+        "senior": ("Senior Data Analyst", "Data Scientist"),
+        "lead": ("Principal Data Scientist", "Analytics Manager"),
+        "executive": ("Head of Analytics", "Chief Data Officer")
+    }),
+    "product_manager": MappingProxyType({
+        "junior": ("Associate Product Manager", "Product Analyst"),
+        "mid": ("Product Manager",),
+        "senior": ("Senior Product Manager", "Product Lead"),
+        "lead": ("Principal Product Manager", "Group Product Manager"),
+        "executive": ("VP Product", "Chief Product Officer")
+    })
+})
+
+# Skill requirements by level
+_SKILL_REQUIREMENTS = MappingProxyType({
+    "junior": ("Foundation skills", "Basic tools", "Learning mindset"),
+    "mid": ("Proficiency in core skills", "Some specialization", "Project experience"),
+    "senior": ("Expert level skills", "Leadership capabilities", "Mentoring abilities"),
+    "lead": ("Strategic thinking", "Team management", "Cross-functional collaboration"),
+    "executive": ("Vision and strategy", "Organization leadership", "Business acumen")
+})
+
+# Every example role per track, lower-cased once for the substring match on user titles
+_TRACK_ROLES_LOWER = tuple(
+    (track, tuple(role.lower() for roles in levels.values() for role in roles))
+    for track, levels in _CAREER_PATHS.items()
+)
+
+def _detect_career_track(current_lower: str, target_lower: str) -> str:
+    """Return the last track (in table order) with an example role found in either role.
+
+    Later tracks take precedence, so a generic match such as "cto" inside "director" does not
+    override a more specific track named by the other role.
+    """
+    for track, roles in reversed(_TRACK_ROLES_LOWER):
+        for role in roles:
+            if role in current_lower or role in target_lower:
+                return track
+    return "general"
+
+
+# Seniority keywords, matched as substrings of the lower-cased role
+_SENIOR_LEVEL_RE = re.compile(r'senior|lead|principal')
+_LEAD_LEVEL_RE = re.compile(r'manager|director|vp')
+_MID_LEVEL_RE = re.compile(r'ii|2|mid')
+_EXECUTIVE_LEVEL_RE = re.compile(r'cto|cpo|chief')
+
+# Technical then soft skills expected at each target level
+_SENIOR_TECHNICAL_SKILLS = ("Advanced technical expertise", "System design", "Architecture")
+_SENIOR_SOFT_SKILLS = ("Leadership", "Communication", "Strategic thinking")
+_LEAD_SOFT_SKILLS = ("Team management", "Business acumen", "Vision setting")
+_SKILLS_NEEDED = MappingProxyType({
+    "junior": (),
+    "mid": (),
+    "senior": _SENIOR_TECHNICAL_SKILLS + _SENIOR_SOFT_SKILLS,
+    "lead": _SENIOR_TECHNICAL_SKILLS + _SENIOR_SOFT_SKILLS + _LEAD_SOFT_SKILLS,
+    "executive": _SENIOR_TECHNICAL_SKILLS + _SENIOR_SOFT_SKILLS + _LEAD_SOFT_SKILLS
+})
+
+
+def _index_needed_skill_substrings() -> Dict[str, Tuple[str, ...]]:
+    index: Dict[str, List[str]] = {}
+    for skill in _SKILLS_NEEDED["executive"]:
+        lowered = skill.lower()
+        substrings = {lowered[i:j] for i in range(len(lowered) + 1) for j in range(i, len(lowered) + 1)}
+        for substring in substrings:
+            index.setdefault(substring, []).append(skill)
+    return {substring: tuple(skills) for substring, skills in index.items()}
+
+
+# A current skill covers a needed skill when it is a substring of it; indexing every
+# substring of the few needed skills turns that test into one dict lookup per skill
+_NEEDED_SKILLS_BY_SUBSTRING = MappingProxyType(_index_needed_skill_substrings())
+
+
+# Development plan content shared by every assessment; only the skill focus line varies
+_IMMEDIATE_ACTIONS = (
+    "Identify a mentor in your target role",
+    "Start taking on projects that align with target responsibilities",
+    "Build relationships with people in similar roles"
+)
+_SKILL_DEVELOPMENT_STEPS = (
+    "Seek stretch assignments and cross-functional projects",
+    "Consider relevant certifications or training programs"
+)
+_EXPERIENCE_BUILDING = (
+    "Volunteer for leadership opportunities",
+    "Document and quantify your achievements",
+    "Build a portfolio of successful projects"
+)
+_SUCCESS_METRICS = (
+    "Increased responsibility and scope",
+    "Team leadership opportunities",
+    "Cross-functional collaboration",
+    "Measurable business impact",
+    "Industry recognition"
+)
+
+_LEVEL_ORDER = ("junior", "mid", "senior", "lead", "executive")
+_LEVEL_INDEX = MappingProxyType({level: index for index, level in enumerate(_LEVEL_ORDER)})
+
+# Display names, titled and interned once instead of per assessment
+_LEVEL_DISPLAY = MappingProxyType({level: sys.intern(level.title()) for level in _LEVEL_ORDER})
+_TRACK_DISPLAY = MappingProxyType({
+    track: sys.intern(track.replace("_", " ").title()) for track in (*_CAREER_PATHS, "general")
+})
+
+
+def _build_progression_steps() -> Dict[str, Tuple[Mapping[str, Any], ...]]:
+    steps: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+    for track in (*_CAREER_PATHS, "general"):
+        roles_by_level = _CAREER_PATHS.get(track, {})
+        steps[track] = tuple(
+            MappingProxyType({
+                "level": _LEVEL_DISPLAY[level],
+                "example_roles": roles_by_level.get(level, (f"{_LEVEL_DISPLAY[level]} Level Role",)),
+                "typical_timeline": "1-3 years" if level in ("mid", "senior") else "2-5 years",
+                "key_requirements": _SKILL_REQUIREMENTS[level]
+            })
+            for level in _LEVEL_ORDER
+        )
+    return steps
+
+
+# Roadmap step for every (track, level), in level order; read-only because every assessment shares them
+_PROGRESSION_STEPS = MappingProxyType(_build_progression_steps())
+
 
 # Career Development Tools
 @tool
@@ -56,69 +617,36 @@ def analyze_job_market(job_title: str, location: str, experience_level: str) ->
         'High'
     """
     try:
-        # Use real job search APIs (JSearch/RapidAPI for Indeed/LinkedIn data)
-        headers = {
-            'X-RapidAPI-Key': os.environ.get('RAPIDAPI_KEY', ''),
-            'X-RapidAPI-Host': 'jsearch.p.rapidapi.com'
-        }
-        
-        # Real API call to JSearch
-        url = "https://jsearch.p.rapidapi.com/search"
-        params = {
-            'query': f"{job_title} {experience_level}",
-            'page': '1',
-            'num_pages': '3',
-            'date_posted': 'month',
-            'remote_jobs_only': 'false',
-            'employment_types': 'FULLTIME',
-            'job_requirements': experience_level,
-            'country': 'US'
-        }
-        
-        if location.lower() != 'remote':
-            params['query'] += f" {location}"
-        
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                jobs = data.get('data', [])
-            else:
-                jobs = []
-        except:
-            jobs = []
+        jobs = _fetch_jobs(job_title, location, experience_level)
         
         # Process real job data
         if jobs:
-            salaries = []
+            midpoints = []
             companies = []
-            skills = []
-            
-            for job in jobs[:20]:  # Analyze first 20 jobs
-                # Extract salary information
-                salary_info = job.get('job_salary_info', {})
-                if salary_info:
-                    min_sal = salary_info.get('salary_min')
-                    max_sal = salary_info.get('salary_max')
-                    if min_sal and max_sal:
-                        salaries.append((min_sal + max_sal) / 2)
+            skill_frequency = Counter()
+            for job in islice(jobs, 20):  # Analyze first 20 jobs
+                # Salary midpoint for postings that publish both ends of the range
+                salary_info = job.get('job_salary_info') or {}
+                min_sal = salary_info.get('salary_min')
+                max_sal = salary_info.get('salary_max')
+                if min_sal and max_sal:
+                    midpoints.append((min_sal + max_sal) / 2)
                 
                 companies.append(job.get('employer_name', 'Unknown'))
                 
                 # Extract skills from job description
-                description = job.get('job_description', '').lower()
-                common_skills = ['python', 'javascript', 'sql', 'aws', 'react', 'java', 'docker', 'kubernetes', 'machine learning', 'ai']
-                job_skills = [skill for skill in common_skills if skill in description]
-                skills.extend(job_skills)
+                found = _scan_keywords(job.get('job_description', '').lower())['job_skill']
+                skill_frequency.update(skill for skill in _COMMON_SKILLS if skill in found)
             
-            # Calculate market insights
-            avg_salary = sum(salaries) / len(salaries) if salaries else 0
-            skill_frequency = {}
-            for skill in skills:
-                skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
+            salaries = np.fromiter(midpoints, dtype=np.float64, count=len(midpoints))
             
-            top_skills = sorted(skill_frequency.items(), key=lambda x: x[1], reverse=True)[:10]
-            top_companies = list(set(companies))[:15]
+            # Calculate market insights
+            if salaries.size:
+                avg_salary, min_salary, max_salary = salary_stats(salaries)
+            else:
+                avg_salary = 0
+            top_skills = skill_frequency.most_common(10)
+            top_companies = list(islice(dict.fromkeys(companies), 15))
             
             market_analysis = {
                 "job_title": job_title,
@@ -127,8 +655,8 @@ def analyze_job_market(job_title: str, location: str, experience_level: str) ->
                 "total_jobs_found": len(jobs),
                 "salary_insights": {
                     "average_salary": round(avg_salary, 0) if avg_salary > 0 else "Data not available",
-                    "salary_range": f"${min(salaries):,.0f} - ${max(salaries):,.0f}" if salaries else "Varies",
-                    "data_points": len(salaries)
+                    "salary_range": f"${min_salary:,.0f} - ${max_salary:,.0f}" if salaries.size else "Varies",
+                    "data_points": int(salaries.size)
                 },
                 "top_skills_demanded": [{"skill": skill, "frequency": freq} for skill, freq in top_skills],
                 "top_hiring_companies": top_companies,
@@ -139,7 +667,7 @@ def analyze_job_market(job_title: str, location: str, experience_level: str) ->
                         "company": job.get('employer_name', 'N/A'),
                         "location": job.get('job_city', 'N/A'),
                         "posted": job.get('job_posted_at_date', 'N/A')
-                    } for job in jobs[:5]
+                    } for job in islice(jobs, 5)
                 ]
             }
         else:
@@ -204,32 +732,18 @@ def get_salary_benchmarks(job_title: str, location: str, years_experience: int)
         # Try PayScale API (if available)
         try:
             # This would be a real API call to PayScale or similar
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; CareerAgent/1.0)'}
-            
             # Simulate realistic salary data based on common patterns
-            base_salary = 50000
-            if 'senior' in job_title.lower() or years_experience > 5:
-                base_salary = 85000 + (years_experience * 3000)
-            elif 'lead' in job_title.lower() or 'principal' in job_title.lower():
-                base_salary = 120000 + (years_experience * 5000)
-            elif 'manager' in job_title.lower():
-                base_salary = 95000 + (years_experience * 4000)
+            title_lower = job_title.lower()
+            if years_experience > 5:
+                level = 'senior'
             else:
-                base_salary = 55000 + (years_experience * 4000)
-            
-            # Location adjustments (realistic multipliers)
-            location_multipliers = {
-                'san francisco': 1.4, 'new york': 1.3, 'seattle': 1.25,
-                'boston': 1.2, 'los angeles': 1.15, 'chicago': 1.1,
-                'austin': 1.05, 'denver': 1.0, 'atlanta': 0.95,
-                'remote': 1.1
-            }
+                level = _best_keyword(_SALARY_TITLE_RE, _SALARY_TITLE_RANK, title_lower)
+            band_base, yearly_raise = _SALARY_BANDS.get(level, _DEFAULT_SALARY_BAND)
+            base_salary = band_base + (years_experience * yearly_raise)
             
-            multiplier = 1.0
-            for city, mult in location_multipliers.items():
-                if city in location.lower():
-                    multiplier = mult
-                    break
+            # Location adjustments; when several cities appear the earlier table entry wins
+            city = _best_keyword(_LOCATION_RE, _LOCATION_RANK, location.lower())
+            multiplier = _LOCATION_MULTIPLIERS[city] if city else 1.0
             
             adjusted_salary = base_salary * multiplier
             
@@ -247,7 +761,7 @@ def get_salary_benchmarks(job_title: str, location: str, years_experience: int)
                 "total_compensation": {
                     "base_salary": round(adjusted_salary, 0),
                     "estimated_bonus": round(adjusted_salary * 0.1, 0),
-                    "stock_options": round(adjusted_salary * 0.05, 0) if 'tech' in job_title.lower() else 0,
+                    "stock_options": round(adjusted_salary * 0.05, 0) if 'tech' in title_lower else 0,
                     "benefits_value": round(adjusted_salary * 0.2, 0)
                 },
                 "market_position": "Competitive" if adjusted_salary > base_salary else "Below Market",
@@ -257,7 +771,7 @@ def get_salary_benchmarks(job_title: str, location: str, years_experience: int)
                     "leadership_salary": round(adjusted_salary * 2.1, 0)
                 },
                 "data_source": "Market research and industry benchmarks",
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
+                "last_updated": _today()
             }
             
         except Exception as api_error:
@@ -309,22 +823,8 @@ def analyze_resume_optimization(resume_text: str, target_job_description: str) -
         job_desc_lower = target_job_description.lower()
         
         # Extract skills from job description
-        skill_patterns = [
-            r'\b(python|java|javascript|sql|aws|azure|docker|kubernetes|react|angular|vue)\b',
-            r'\b(machine learning|ai|data science|analytics|visualization)\b',
-            r'\b(project management|agile|scrum|leadership|communication)\b',
-            r'\b(bachelor|master|degree|certification|experience)\b'
-        ]
-        
-        job_skills = set()
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, job_desc_lower)
-            job_skills.update(matches)
-        
-        resume_skills = set()
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, resume_lower)
-            resume_skills.update(matches)
+        job_skills = _extract_resume_skills(job_desc_lower)
+        resume_skills = _extract_resume_skills(resume_lower)
         
         # Calculate match score
         matching_skills = job_skills.intersection(resume_skills)
@@ -332,13 +832,8 @@ def analyze_resume_optimization(resume_text: str, target_job_description: str) -
         match_percentage = (len(matching_skills) / len(job_skills)) * 100 if job_skills else 0
         
         # Analyze resume structure
-        sections = {
-            'contact_info': bool(re.search(r'(email|phone|linkedin)', resume_lower)),
-            'summary': bool(re.search(r'(summary|objective|profile)', resume_lower)),
-            'experience': bool(re.search(r'(experience|work|employment)', resume_lower)),
-            'education': bool(re.search(r'(education|degree|university)', resume_lower)),
-            'skills': bool(re.search(r'(skills|technologies|proficient)', resume_lower))
-        }
+        resume_keywords = _scan_keywords(resume_lower)
+        sections = {name: name in resume_keywords['section'] for name in _SECTION_KEYWORDS}
         
         # Generate optimization recommendations
         recommendations = []
@@ -359,11 +854,8 @@ def analyze_resume_optimization(resume_text: str, target_job_description: str) -
             recommendations.append("Consider condensing resume to be more concise")
         
         # Action verbs analysis
-        strong_verbs = ['achieved', 'implemented', 'led', 'developed', 'created', 'improved', 'managed', 'delivered']
-        weak_verbs = ['responsible for', 'worked on', 'helped with', 'participated in']
-        
-        strong_verb_count = sum(1 for verb in strong_verbs if verb in resume_lower)
-        weak_verb_count = sum(1 for verb in weak_verbs if verb in resume_lower)
+        strong_verb_count = len(resume_keywords['strong_verb'])
+        weak_verb_count = len(resume_keywords['weak_verb'])
         
         if weak_verb_count > strong_verb_count:
             recommendations.append("Replace weak action verbs with stronger alternatives")
@@ -384,12 +876,7 @@ def analyze_resume_optimization(resume_text: str, target_job_description: str) -
             "optimization_recommendations": recommendations,
             "ats_compatibility": {
                 "score": "Good" if sections['skills'] and sections['experience'] else "Needs Improvement",
-                "tips": [
-                    "Use standard section headers",
-                    "Include relevant keywords naturally",
-                    "Use consistent formatting",
-                    "Avoid graphics and tables"
-                ]
+                "tips": _ATS_TIPS
             }
         }
         
@@ -438,19 +925,17 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
         # Try to get real company information
         try:
             # This would be a real API call to company research services
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; CareerAgent/1.0)'}
-            
             # Simulate company research
             company_info = {
                 "company_name": company_name,
-                "industry": "Technology" if any(tech in company_name.lower() for tech in ['tech', 'software', 'data', 'ai']) else "Business Services",
+                "industry": "Technology" if any(tech in company_name.lower() for tech in _TECH_COMPANY_KEYWORDS) else "Business Services",
                 "size": "Mid-size (500-2000 employees)",  # Would be real data
                 "recent_news": [
                     f"{company_name} announces new product launch",
                     f"{company_name} expands operations",
                     f"{company_name} receives industry recognition"
                 ],
-                "company_values": ["Innovation", "Collaboration", "Customer Focus", "Integrity"],
+                "company_values": _COMPANY_VALUES,
                 "glassdoor_rating": "4.2/5.0"  # Would be real Glassdoor data
             }
             
@@ -459,14 +944,8 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
         
         # Generate interview questions based on role and type
         interview_questions = {
-            "behavioral": [
-                "Tell me about a time when you had to overcome a significant challenge at work.",
-                "Describe a situation where you had to work with a difficult team member.",
-                "Give me an example of when you had to learn something new quickly.",
-                "Tell me about a project you're particularly proud of.",
-                "Describe a time when you had to make a decision with incomplete information."
-            ],
-            "technical": [],
+            "behavioral": _BEHAVIORAL_QUESTIONS,
+            "technical": (),
             "company_specific": [
                 f"Why do you want to work at {company_name}?",
                 f"What do you know about {company_name}'s products/services?",
@@ -476,40 +955,13 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
         }
         
         # Add technical questions based on job title
-        if 'engineer' in job_title.lower() or 'developer' in job_title.lower():
-            interview_questions["technical"].extend([
-                "Walk me through your approach to debugging a complex issue.",
-                "How do you ensure code quality in your projects?",
-                "Describe your experience with [relevant technology stack].",
-                "How do you handle technical debt in legacy systems?",
-                "What's your process for learning new technologies?"
-            ])
-        elif 'manager' in job_title.lower() or 'lead' in job_title.lower():
-            interview_questions["technical"].extend([
-                "How do you handle underperforming team members?",
-                "Describe your approach to project planning and resource allocation.",
-                "How do you balance technical debt with feature development?",
-                "What's your strategy for building and maintaining team culture?",
-                "How do you handle conflicting priorities from stakeholders?"
-            ])
-        elif 'analyst' in job_title.lower() or 'data' in job_title.lower():
-            interview_questions["technical"].extend([
-                "Walk me through your approach to analyzing a new dataset.",
-                "How do you ensure data quality and accuracy?",
-                "Describe a time when your analysis led to a business decision.",
-                "What tools and methods do you use for data visualization?",
-                "How do you communicate technical findings to non-technical stakeholders?"
-            ])
+        track = _best_keyword(_INTERVIEW_TRACK_RE, _INTERVIEW_TRACK_RANK, job_title.lower())
+        if track:
+            interview_questions["technical"] = _INTERVIEW_TRACK_QUESTIONS[track]
         
         # Preparation strategies
         preparation_plan = {
-            "research_checklist": [
-                f"Study {company_name}'s website and recent news",
-                "Review the job description and requirements",
-                "Research the interviewer(s) on LinkedIn",
-                "Prepare specific examples using STAR method",
-                "Practice common technical concepts"
-            ],
+            "research_checklist": [f"Study {company_name}'s website and recent news", *_RESEARCH_STEPS],
             "star_method_examples": [
                 {
                     "situation": "Describe the context and background",
@@ -518,49 +970,12 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
                     "result": "Share the outcomes and what you learned"
                 }
             ],
-            "questions_to_ask": [
-                "What does success look like in this role?",
-                "What are the biggest challenges facing the team right now?",
-                "How do you measure performance in this position?",
-                "What opportunities are there for professional development?",
-                "Can you tell me about the team I'd be working with?"
-            ]
+            "questions_to_ask": _QUESTIONS_TO_ASK
         }
         
         # Interview type specific advice
-        type_specific_advice = {}
-        if interview_type.lower() == "phone":
-            type_specific_advice = {
-                "preparation": [
-                    "Test your phone connection and find a quiet space",
-                    "Have your resume and notes readily available",
-                    "Stand or sit up straight to project confidence",
-                    "Speak clearly and at a moderate pace"
-                ],
-                "duration": "30-45 minutes typically"
-            }
-        elif interview_type.lower() == "video":
-            type_specific_advice = {
-                "preparation": [
-                    "Test your camera and microphone beforehand",
-                    "Ensure good lighting (face the light source)",
-                    "Choose a professional, uncluttered background",
-                    "Dress professionally from head to toe",
-                    "Make eye contact with the camera, not the screen"
-                ],
-                "duration": "45-60 minutes typically"
-            }
-        elif interview_type.lower() == "onsite" or interview_type.lower() == "in-person":
-            type_specific_advice = {
-                "preparation": [
-                    "Plan your route and arrive 10-15 minutes early",
-                    "Bring multiple copies of your resume",
-                    "Prepare for multiple rounds of interviews",
-                    "Dress professionally and appropriately for company culture",
-                    "Bring a notebook and pen for taking notes"
-                ],
-                "duration": "2-4 hours with multiple interviews"
-            }
+        advice = _INTERVIEW_TYPE_ADVICE.get(interview_type.lower())
+        type_specific_advice = {"preparation": advice[0], "duration": advice[1]} if advice else {}
         
         interview_prep = {
             "job_title": job_title,
@@ -570,13 +985,7 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
             "interview_questions": interview_questions,
             "preparation_plan": preparation_plan,
             "type_specific_advice": type_specific_advice,
-            "success_tips": [
-                "Be authentic and show genuine enthusiasm",
-                "Demonstrate problem-solving skills with specific examples",
-                "Ask thoughtful questions about the role and company",
-                "Follow up with a thank-you email within 24 hours",
-                "Be prepared to discuss your career goals and motivations"
-            ]
+            "success_tips": _SUCCESS_TIPS
         }
         
         return interview_prep
@@ -585,6 +994,81 @@ def create_interview_preparation(job_title: str, company_name: str, interview_ty
         return {"error": f"Interview preparation error: {str(e)}"}
 
 
+@lru_cache(maxsize=512)
+def _assess_career_path(current_role: str, target_role: str, current_skills: Tuple[str, ...]) -> Dict[str, Any]:
+    # Pure in its inputs, so repeated queries share one result; the tool hands out thawed copies
+    current_lower = current_role.lower()
+    target_lower = target_role.lower()
+    
+    # Determine career track
+    career_track = _detect_career_track(current_lower, target_lower)
+    
+    # Assess current level
+    current_level = "junior"
+    if _SENIOR_LEVEL_RE.search(current_lower):
+        current_level = "senior"
+    elif _LEAD_LEVEL_RE.search(current_lower):
+        current_level = "lead"
+    elif _MID_LEVEL_RE.search(current_lower):
+        current_level = "mid"
+    
+    # Assess target level
+    target_level = "mid"
+    if _SENIOR_LEVEL_RE.search(target_lower):
+        target_level = "senior"
+    elif _LEAD_LEVEL_RE.search(target_lower):
+        target_level = "lead"
+    elif _EXECUTIVE_LEVEL_RE.search(target_lower):
+        target_level = "executive"
+    
+    # Create progression roadmap
+    current_index = _LEVEL_INDEX[current_level]
+    target_index = _LEVEL_INDEX[target_level]
+    
+    # Steps above the current level up to the target (empty when not moving up)
+    progression_steps = list(_PROGRESSION_STEPS[career_track][current_index + 1:target_index + 1])
+    
+    # Skill gap analysis
+    skills_needed = _SKILLS_NEEDED[target_level]
+    
+    # Current skills assessment
+    covered = set()
+    for existing in current_skills:
+        covered.update(_NEEDED_SKILLS_BY_SUBSTRING.get(existing.lower(), ()))
+    skill_gaps = [skill for skill in skills_needed if skill not in covered]
+    
+    # Development recommendations
+    priority_gaps = skill_gaps[:5]
+    if priority_gaps:
+        skill_focus = f"Focus on developing: {', '.join(priority_gaps)}"
+    else:
+        skill_focus = "Continue strengthening current skills"
+    development_plan = {
+        "immediate_actions": _IMMEDIATE_ACTIONS,
+        "skill_development": (skill_focus, *_SKILL_DEVELOPMENT_STEPS),
+        "experience_building": _EXPERIENCE_BUILDING
+    }
+    
+    career_assessment = {
+        "current_role": current_role,
+        "target_role": target_role,
+        "career_track": _TRACK_DISPLAY[career_track],
+        "current_level": _LEVEL_DISPLAY[current_level],
+        "target_level": _LEVEL_DISPLAY[target_level],
+        "progression_steps": progression_steps,
+        "estimated_timeline": f"{len(progression_steps) * 2}-{len(progression_steps) * 4} years",
+        "skill_gap_analysis": {
+            "current_skills": list(current_skills),
+            "skills_needed": skills_needed,
+            "priority_skill_gaps": priority_gaps
+        },
+        "development_plan": development_plan,
+        "success_metrics": _SUCCESS_METRICS
+    }
+    
+    return career_assessment
+
+
 @tool
 def assess_career_path_progression(current_role: str, target_role: str, current_skills: List[str]) -> Dict[str, Any]:
     """
@@ -621,154 +1105,8 @@ def assess_career_path_progression(current_role: str, target_role: str, current_
         '2-4 years'
     """
     try:
-        # Define career progression maps
-        career_paths = {
-            "software_engineer": {
-                "junior": ["Software Engineer", "Junior Developer"],
-                "mid": ["Software Engineer II", "Full Stack Developer"],
-                "senior": ["Senior Software Engineer", "Tech Lead"],
-                "lead": ["Principal Engineer", "Engineering Manager", "Architect"],
-                "executive": ["VP Engineering", "CTO", "Chief Architect"]
-            },
-            "data_analyst": {
-                "junior": ["Data Analyst", "Junior Analyst"],
-                "mid": ["Data Analyst II", "Business Analyst"],
-                "senior": ["Senior Data Analyst", "Data Scientist"],
-                "lead": ["Principal Data Scientist", "Analytics Manager"],
-                "executive": ["Head of Analytics", "Chief Data Officer"]
-            },
-            "product_manager": {
-                "junior": ["Associate Product Manager", "Product Analyst"],
-                "mid": ["Product Manager"],
-                "senior": ["Senior Product Manager", "Product Lead"],
-                "lead": ["Principal Product Manager", "Group Product Manager"],
-                "executive": ["VP Product", "Chief Product Officer"]
-            }
-        }
-        
-        # Skill requirements by level
-        skill_requirements = {
-            "junior": ["Foundation skills", "Basic tools", "Learning mindset"],
-            "mid": ["Proficiency in core skills", "Some specialization", "Project experience"],
-            "senior": ["Expert level skills", "Leadership capabilities", "Mentoring abilities"],
-            "lead": ["Strategic thinking", "Team management", "Cross-functional collaboration"],
-            "executive": ["Vision and strategy", "Organization leadership", "Business acumen"]
-        }
-        
-        # Determine career track
-        career_track = "general"
-        for track, levels in career_paths.items():
-            for level, roles in levels.items():
-                if any(role.lower() in current_role.lower() for role in roles):
-                    career_track = track
-                    break
-                if any(role.lower() in target_role.lower() for role in roles):
-                    career_track = track
-                    break
-        
-        # Assess current level
-        current_level = "junior"
-        if any(keyword in current_role.lower() for keyword in ["senior", "lead", "principal"]):
-            current_level = "senior"
-        elif any(keyword in current_role.lower() for keyword in ["manager", "director", "vp"]):
-            current_level = "lead"
-        elif any(keyword in current_role.lower() for keyword in ["ii", "2", "mid"]):
-            current_level = "mid"
-        
-        # Assess target level
-        target_level = "mid"
-        if any(keyword in target_role.lower() for keyword in ["senior", "lead", "principal"]):
-            target_level = "senior"
-        elif any(keyword in target_role.lower() for keyword in ["manager", "director", "vp"]):
-            target_level = "lead"
-        elif any(keyword in target_role.lower() for keyword in ["cto", "cpo", "chief"]):
-            target_level = "executive"
-        
-        # Create progression roadmap
-        level_order = ["junior", "mid", "senior", "lead", "executive"]
-        current_index = level_order.index(current_level)
-        target_index = level_order.index(target_level)
-        
-        progression_steps = []
-        if target_index > current_index:
-            for i in range(current_index + 1, target_index + 1):
-                level = level_order[i]
-                if career_track in career_paths:
-                    example_roles = career_paths[career_track].get(level, [f"{level.title()} Level Role"])
-                else:
-                    example_roles = [f"{level.title()} Level Role"]
-                
-                progression_steps.append({
-                    "level": level.title(),
-                    "example_roles": example_roles,
-                    "typical_timeline": "1-3 years" if level in ["mid", "senior"] else "2-5 years",
-                    "key_requirements": skill_requirements[level]
-                })
-        
-        # Skill gap analysis
-        technical_skills_needed = []
-        soft_skills_needed = []
-        
-        if target_level in ["senior", "lead", "executive"]:
-            technical_skills_needed.extend(["Advanced technical expertise", "System design", "Architecture"])
-            soft_skills_needed.extend(["Leadership", "Communication", "Strategic thinking"])
-        
-        if target_level in ["lead", "executive"]:
-            soft_skills_needed.extend(["Team management", "Business acumen", "Vision setting"])
-        
-        # Current skills assessment
-        current_skills_lower = [skill.lower() for skill in current_skills]
-        skill_gaps = []
-        
-        for skill in technical_skills_needed + soft_skills_needed:
-            if not any(existing in skill.lower() for existing in current_skills_lower):
-                skill_gaps.append(skill)
-        
-        # Development recommendations
-        development_plan = {
-            "immediate_actions": [
-                "Identify a mentor in your target role",
-                "Start taking on projects that align with target responsibilities",
-                "Build relationships with people in similar roles"
-            ],
-            "skill_development": [
-                f"Focus on developing: {', '.join(skill_gaps[:5])}" if skill_gaps else "Continue strengthening current skills",
-                "Seek stretch assignments and cross-functional projects",
-                "Consider relevant certifications or training programs"
-            ],
-            "experience_building": [
-                "Volunteer for leadership opportunities",
-                "Document and quantify your achievements",
-                "Build a portfolio of successful projects"
-            ]
-        }
-        
-        career_assessment = {
-            "current_role": current_role,
-            "target_role": target_role,
-            "career_track": career_track.replace("_", " ").title(),
-            "current_level": current_level.title(),
-            "target_level": target_level.title(),
-            "progression_steps": progression_steps,
-            "estimated_timeline": f"{len(progression_steps) * 2}-{len(progression_steps) * 4} years",
-            "skill_gap_analysis": {
-                "current_skills": current_skills,
-                "skills_needed": technical_skills_needed + soft_skills_needed,
-                "priority_skill_gaps": skill_gaps[:5]
-            },
-            "development_plan": development_plan,
-            "success_metrics": [
-                "Increased responsibility and scope",
-                "Team leadership opportunities",
-                "Cross-functional collaboration",
-                "Measurable business impact",
-                "Industry recognition"
-            ]
-        }
-        
-        return career_assessment
-        
-    except Exception as e:
+        return thaw(_assess_career_path(current_role, target_role, tuple(current_skills)))
+    except (TypeError, AttributeError) as e:  # non-string roles or skills
         return {"error": f"Career path assessment error: {str(e)}"}
 
 
@@ -783,37 +1121,87 @@ async def career_development_agent(career_query: str) -> str:
 class CareerDevelopmentAgent:
     """Real-world career development agent for job search and professional growth."""
     
+    # Built once at import; read-only so callers cannot mutate the shared scenarios
+    _SCENARIOS: Tuple[Mapping[str, Any], ...] = (
+        MappingProxyType({
+            "scenario": "Job market analysis for career transition",
+            "prompt": "I'm a software engineer with 3 years experience looking to transition to data science. Analyze the job market for data scientist roles in San Francisco.",
+            "category": "career_transition"
+        }),
+        MappingProxyType({
+            "scenario": "Salary negotiation preparation",
+            "prompt": "I have 5 years experience as a product manager in Austin and received an offer in Seattle. What are fair salary benchmarks for my level?",
+            "category": "salary_research"
+        }),
+        MappingProxyType({
+            "scenario": "Resume optimization for job applications",
+            "prompt": "Optimize my resume for a senior software engineer position at a fintech company. Focus on backend development and scalability experience.",
+            "category": "resume_optimization"
+        }),
+        MappingProxyType({
+            "scenario": "Interview preparation for promotion",
+            "prompt": "I'm interviewing for a team lead position at my current company. Help me prepare for behavioral and technical leadership questions.",
+            "category": "interview_prep"
+        }),
+        MappingProxyType({
+            "scenario": "Career path planning and development",
+            "prompt": "I'm currently a data analyst and want to become a Chief Data Officer. What's the career progression path and what skills do I need?",
+            "category": "career_planning"
+        })
+    )
+    
+    # Workflow prototypes shared by all instances, built on first use
+    _workflows = WorkflowPrototypes()
+    
     def __init__(self):
         self.name = "CareerDevelopmentAgent"
         self.complexity_level = 7
         self.description = "Real-world career development agent for job search, salary analysis, resume optimization, and career planning"
+        
+        # LLM endpoint settings, read once; workflows are built and shared per endpoint
+        self._api_key = os.environ.get("API_KEY", "")
+        self._base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
+        if not self._api_key:
+            raise ValueError("API_KEY environment variable is required")
     
     async def create_workflow(self) -> WorkflowGraph:
-        """Create the career development workflow."""
+        """Create the career development workflow (a private copy of the shared prototype)."""
+        return await self._workflows.copy(self._workflow_key(), self._build_workflow)
+    
+    async def warmup(self) -> None:
+        """Build the shared workflow prototype (tool schemas, agents) ahead of the first request."""
+        await self._workflows.warmup(self._workflow_key(), self._build_workflow)
+    
+    def _workflow_key(self) -> Tuple[Any, ...]:
+        return (type(self), self._api_key, self._base_url)
+    
+    async def _build_workflow(self) -> WorkflowGraph:
+        """Build the career development workflow graph."""
         try:
-            api_key = os.environ.get("API_KEY", "")
-            base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
+            api_key = self._api_key
+            base_url = self._base_url
             
-            if not api_key:
-                raise ValueError("API_KEY environment variable is required")
+            # Generate all tool schemas concurrently; each one may round-trip to the LLM
+            (
+                market_schema,
+                salary_schema,
+                resume_schema,
+                interview_schema,
+                path_schema,
+                response_agent
+            ) = await asyncio.gather(
+                cached_schema(analyze_job_market, func_name="analyze_job_market", enhance_description=True),
+                cached_schema(get_salary_benchmarks, func_name="get_salary_benchmarks", enhance_description=True),
+                cached_schema(analyze_resume_optimization, func_name="analyze_resume_optimization", enhance_description=True),
+                cached_schema(create_interview_preparation, func_name="create_interview_preparation", enhance_description=True),
+                cached_schema(assess_career_path_progression, func_name="assess_career_path_progression", enhance_description=True),
+                cached_schema(career_development_agent, func_name="career_development_agent", enhance_description=True),
+            )
             
             # Create tools for different career domains
-            job_search_tools = [
-                await function_to_schema(analyze_job_market, func_name="analyze_job_market", enhance_description=True),
-                await function_to_schema(get_salary_benchmarks, func_name="get_salary_benchmarks", enhance_description=True),
-            ]
-            
-            application_tools = [
-                await function_to_schema(analyze_resume_optimization, func_name="analyze_resume_optimization", enhance_description=True),
-                await function_to_schema(create_interview_preparation, func_name="create_interview_preparation", enhance_description=True),
-            ]
-            
-            planning_tools = [
-                await function_to_schema(assess_career_path_progression, func_name="assess_career_path_progression", enhance_description=True),
-            ]
-            
-            # Create response agent
-            response_agent = await function_to_schema(career_development_agent, func_name="career_development_agent", enhance_description=True)
+            job_search_tools = [market_schema, salary_schema]
+            application_tools = [resume_schema, interview_schema]
+            planning_tools = [path_schema]
             
             # Create main orchestrator with routing capability
             all_tools = job_search_tools + application_tools + planning_tools + [response_agent]
@@ -886,39 +1274,14 @@ class CareerDevelopmentAgent:
             print(f"Error creating workflow: {e}")
             raise
     
-    def get_real_world_scenarios(self) -> List[Dict[str, Any]]:
+    def get_real_world_scenarios(self) -> Tuple[Mapping[str, Any], ...]:
         """Get real-world career development scenarios."""
-        return [
-            {
-                "scenario": "Job market analysis for career transition",
-                "prompt": "I'm a software engineer with 3 years experience looking to transition to data science. Analyze the job market for data scientist roles in San Francisco.",
-                "category": "career_transition"
-            },
-            {
-                "scenario": "Salary negotiation preparation",
-                "prompt": "I have 5 years experience as a product manager in Austin and received an offer in Seattle. What are fair salary benchmarks for my level?",
-                "category": "salary_research"
-            },
-            {
-                "scenario": "Resume optimization for job applications",
-                "prompt": "Optimize my resume for a senior software engineer position at a fintech company. Focus on backend development and scalability experience.",
-                "category": "resume_optimization"
-            },
-            {
-                "scenario": "Interview preparation for promotion",
-                "prompt": "I'm interviewing for a team lead position at my current company. Help me prepare for behavioral and technical leadership questions.",
-                "category": "interview_prep"
-            },
-            {
-                "scenario": "Career path planning and development",
-                "prompt": "I'm currently a data analyst and want to become a Chief Data Officer. What's the career progression path and what skills do I need?",
-                "category": "career_planning"
-            }
-        ]
+        return self._SCENARIOS
     
     async def provide_career_guidance(self, scenario: str) -> Dict[str, Any]:
         """Provide comprehensive career development guidance."""
         try:
+            # Compiled per scenario: a CompiledGraph accumulates execution memory across runs
             workflow = await self.create_workflow()
             compiled_graph = workflow.compile()
             
@@ -5,20 +5,336 @@ Helps businesses make informed decisions through comprehensive market research a
 
 import os
 import asyncio
-import json
-import requests
 import re
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 from orion.agent_core import create_orchestrator, build_async_agent
-from orion.agent_core.utils import function_to_schema
 from orion.graph_core import WorkflowGraph
 from orion.tool_registry import tool
 
+from ._common import WorkflowPrototypes, cached_schema, freeze, thaw
+
+
+# Static analysis content, built once at import and shared by the cached analyses below.
+# Nested templates are frozen so no cached analysis can be altered through them.
+
+# Two-way labels indexed by the predicate that picks between them (False, True)
+_MARKET_POSITION = ("Moderate", "Strong")
+_COMPETITIVE_INTENSITY = ("Moderate", "High")
+_THREAT_LEVEL = ("Medium", "Medium-High")
+_MARKET_HEALTH = ("Stable", "Growing")
+
+_COMPETITOR_STRENGTHS = (
+    "Strong brand recognition",
+    "Diverse product portfolio"
+)
+_COMPETITOR_WEAKNESSES = (
+    "Higher pricing",
+    "Slower innovation"
+)
+_MARKET_GAPS = (
+    "Affordable premium segment",
+    "SMB market underserved",
+    "Emerging market opportunities"
+)
+
+_DEFAULT_FOCUS_AREAS = ("technology", "consumer_behavior", "regulations", "economic_factors")
+_KEY_GROWTH_DRIVERS = (
+    "Digital transformation acceleration",
+    "Changing consumer preferences",
+    "Regulatory changes"
+)
+_HOT_SECTORS = ("AI/ML", "Sustainability", "Healthcare", "Fintech")
+
+_TREND_INSIGHTS = freeze({
+    "technology": {
+        "key_trends": [
+            "AI and automation adoption",
+            "Cloud migration acceleration",
+            "Data privacy emphasis"
+        ],
+        "impact_level": "High",
+        "timeline": "1-2 years"
+    },
+    "consumer_behavior": {
+        "key_trends": [
+            "Sustainability focus increasing",
+            "Remote work normalization",
+            "Digital-first expectations"
+        ],
+        "impact_level": "High",
+        "timeline": "Immediate"
+    },
+    "regulations": {
+        "key_trends": [
+            "Data protection requirements",
+            "ESG compliance mandates",
+            "Industry-specific regulations"
+        ],
+        "impact_level": "Medium",
+        "timeline": "6-18 months"
+    }
+})
+_DEFAULT_TREND_INSIGHT = freeze({
+    "key_trends": [
+        "Economic uncertainty impact",
+        "Supply chain resilience focus",
+        "Investment pattern shifts"
+    ],
+    "impact_level": "Medium",
+    "timeline": "3-12 months"
+})
+
+_SWOT_ANALYSIS = freeze({
+    "opportunities": [
+        "Emerging market expansion",
+        "Technology adoption gap",
+        "Sustainability solutions demand",
+        "Partnership possibilities"
+    ],
+    "threats": [
+        "Increased competition",
+        "Economic volatility",
+        "Regulatory changes",
+        "Technology disruption"
+    ]
+})
+
+_B2B_SEGMENTS = freeze({
+    "enterprise": {
+        "size": "Large (1000+ employees)",
+        "characteristics": ["Complex needs", "Long sales cycles", "High value contracts"],
+        "pain_points": ["Integration challenges", "Scalability requirements", "Compliance needs"],
+        "market_size": "25% of total market",
+        "growth_potential": "Steady",
+        "acquisition_cost": "High"
+    },
+    "mid_market": {
+        "size": "Medium (100-1000 employees)",
+        "characteristics": ["Balanced needs", "Moderate complexity", "Growth-focused"],
+        "pain_points": ["Resource constraints", "Technology gaps", "Efficiency needs"],
+        "market_size": "45% of total market",
+        "growth_potential": "High",
+        "acquisition_cost": "Medium"
+    },
+    "small_business": {
+        "size": "Small (10-100 employees)",
+        "characteristics": ["Simple needs", "Price sensitive", "Quick decisions"],
+        "pain_points": ["Budget limitations", "Limited IT resources", "Time constraints"],
+        "market_size": "30% of total market",
+        "growth_potential": "Very High",
+        "acquisition_cost": "Low"
+    }
+})
+
+_B2C_SEGMENTS = freeze({
+    "premium": {
+        "demographics": "High income, urban, 25-45 years",
+        "characteristics": ["Quality-focused", "Brand conscious", "Early adopters"],
+        "pain_points": ["Time constraints", "Quality concerns", "Status needs"],
+        "market_size": "20% of total market",
+        "growth_potential": "Moderate",
+        "acquisition_cost": "High"
+    },
+    "mainstream": {
+        "demographics": "Middle income, suburban, 30-55 years",
+        "characteristics": ["Value-conscious", "Practical", "Research-driven"],
+        "pain_points": ["Price vs quality balance", "Reliability needs", "Family considerations"],
+        "market_size": "60% of total market",
+        "growth_potential": "Steady",
+        "acquisition_cost": "Medium"
+    },
+    "budget_conscious": {
+        "demographics": "Lower-middle income, diverse locations, 18-65 years",
+        "characteristics": ["Price sensitive", "Necessity-focused", "Word-of-mouth driven"],
+        "pain_points": ["Affordability", "Value demonstration", "Trust building"],
+        "market_size": "20% of total market",
+        "growth_potential": "High",
+        "acquisition_cost": "Low"
+    }
+})
+
+_PENETRATION_ANALYSIS = freeze({
+    "current_penetration": "15-25% depending on segment",
+    "saturation_level": "Low to Medium",
+    "untapped_opportunities": [
+        "Geographic expansion",
+        "New customer segments",
+        "Product line extension",
+        "Channel diversification"
+    ]
+})
+
+# Target markets whose entry carries heavy regulatory overhead
+_REGULATED_MARKET_RE = re.compile(r"healthcare|financial|education")
+# Business-type keywords; neither can overlap the other, so one findall reports both
+_BUSINESS_TYPE_TAG_RE = re.compile(r"tech|digital")
+
+_ENTRY_STRATEGY_OPTIONS = freeze([
+    {
+        "strategy": "Direct Market Entry",
+        "description": "Establish operations directly in target market",
+        "advantages": ["Full control", "Higher margins", "Brand building"],
+        "disadvantages": ["High investment", "High risk", "Longer timeline"],
+        "suitability": "High budget, long timeline",
+        "risk_level": "High",
+        "investment_required": "High"
+    },
+    {
+        "strategy": "Strategic Partnership",
+        "description": "Partner with established local players",
+        "advantages": ["Reduced risk", "Local expertise", "Faster entry"],
+        "disadvantages": ["Shared control", "Lower margins", "Dependency"],
+        "suitability": "Medium budget, medium timeline",
+        "risk_level": "Medium",
+        "investment_required": "Medium"
+    },
+    {
+        "strategy": "Licensing/Franchising",
+        "description": "License business model to local operators",
+        "advantages": ["Low investment", "Rapid scaling", "Local adaptation"],
+        "disadvantages": ["Limited control", "Lower revenue", "Quality concerns"],
+        "suitability": "Low budget, short timeline",
+        "risk_level": "Low",
+        "investment_required": "Low"
+    }
+])
+_DIGITAL_FIRST_ENTRY = freeze({
+    "strategy": "Digital-First Entry",
+    "description": "Enter market through digital channels",
+    "advantages": ["Low overhead", "Scalable", "Data-driven"],
+    "disadvantages": ["Limited local presence", "Digital competition", "Customer trust"],
+    "suitability": "Any budget, short timeline",
+    "risk_level": "Medium",
+    "investment_required": "Low-Medium"
+})
+_ENTRY_SUCCESS_FACTORS = (
+    "Strong value proposition for local market",
+    "Understanding of local regulations and culture",
+    "Adequate funding and resource allocation",
+    "Strong local partnerships or talent",
+    "Adaptive business model",
+    "Clear go-to-market strategy"
+)
+_ENTRY_RISK_MITIGATION = (
+    "Conduct pilot program before full launch",
+    "Secure local legal and regulatory expertise",
+    "Build strong local partnerships",
+    "Maintain financial reserves for unexpected costs",
+    "Develop exit strategy if needed"
+)
+
+_MONITORING_DATA_SOURCES = (
+    "Financial databases",
+    "Government statistics",
+    "Patent databases",
+    "Social media sentiment"
+)
+_MONITORING_EXPERT_NETWORKS = (
+    "Industry associations",
+    "Professional networks",
+    "Analyst firms",
+    "Academic institutions"
+)
+_INTELLIGENCE_SUCCESS_METRICS = (
+    "Early identification of market opportunities",
+    "Proactive response to competitive threats",
+    "Informed strategic decision making",
+    "Reduced market entry risks",
+    "Improved market positioning"
+)
+
+_MONITORING_FRAMEWORKS = freeze({
+    "competitors": {
+        "metrics": ["Product launches", "Funding rounds", "Executive changes", "Market share shifts"],
+        "sources": ["Company websites", "Press releases", "SEC filings", "News alerts"],
+        "frequency": "Daily",
+        "alert_threshold": "Significant developments"
+    },
+    "market_trends": {
+        "metrics": ["Market size", "Growth rates", "Technology adoption", "Consumer behavior"],
+        "sources": ["Market research", "Survey data", "Government reports", "Analyst reports"],
+        "frequency": "Weekly",
+        "alert_threshold": "Trend changes > 10%"
+    },
+    "regulations": {
+        "metrics": ["New regulations", "Policy changes", "Compliance requirements", "Legal precedents"],
+        "sources": ["Government websites", "Legal databases", "Industry alerts", "Law firms"],
+        "frequency": "Weekly",
+        "alert_threshold": "New regulatory announcements"
+    },
+    "technology": {
+        "metrics": ["Patent filings", "R&D investments", "Technology breakthroughs", "Startup funding"],
+        "sources": ["Patent databases", "Research publications", "Tech news", "Investment reports"],
+        "frequency": "Bi-weekly",
+        "alert_threshold": "Disruptive technology emergence"
+    }
+})
+
+
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string, formatted once per second."""
+    return _format_second(int(time.time()))
+
 
 # Market Intelligence Tools
+# Each tool memoizes its analysis per argument tuple and stamps a fresh date on every call.
+# Cached analyses are shared between calls, so the tools return a thawed (deep) copy.
+@lru_cache(maxsize=512)
+def _competitor_profile(competitor: str) -> Dict[str, Any]:
+    """Profile a single competitor; the unit of work a real data source would fetch per company."""
+    # Simulate competitor data collection
+    return {
+        "name": competitor,
+        "market_position": _MARKET_POSITION[len(competitor) > 8],
+        "strengths": _COMPETITOR_STRENGTHS,
+        "weaknesses": _COMPETITOR_WEAKNESSES,
+        "estimated_market_share": f"{15 + (len(competitor) % 20)}%",
+        "key_products": [f"{competitor} Product A", f"{competitor} Service B"],
+        "recent_developments": [
+            f"{competitor} launched new product line",
+            f"{competitor} expanded to new market"
+        ]
+    }
+
+
+@lru_cache(maxsize=512)
+def _competitive_analysis(competitors: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build the date-independent part of a competitive analysis."""
+    # Simulate competitive research data (in real implementation, would use APIs and web scraping)
+    competitor_profiles = [_competitor_profile(competitor) for competitor in competitors]
+    
+    # Market position analysis
+    competitive_landscape = {
+        "market_leaders": list(competitors[:2]),
+        "emerging_players": list(competitors[2:]),
+        "market_gaps": _MARKET_GAPS,
+        "competitive_intensity": _COMPETITIVE_INTENSITY[len(competitors) > 4]
+    }
+    
+    # Strategic recommendations
+    recommendations = [
+        f"Differentiate from {competitors[0]} through pricing strategy" if competitors else "Focus on unique value proposition",
+        "Leverage technology for competitive advantage",
+        "Consider strategic partnerships to expand market reach",
+        "Invest in customer experience improvements"
+    ]
+    
+    return {
+        "competitor_profiles": competitor_profiles,
+        "competitive_landscape": competitive_landscape,
+        "strategic_recommendations": recommendations,
+        "threat_level": _THREAT_LEVEL[len(competitors) > 3]
+    }
+
+
 @tool
 def conduct_competitive_analysis(company_name: str, industry: str, competitors: List[str]) -> Dict[str, Any]:
     """
@@ -56,71 +372,50 @@ def conduct_competitive_analysis(company_name: str, industry: str, competitors:
         'Medium-High'
     """
     try:
-        # Simulate competitive research data (in real implementation, would use APIs and web scraping)
-        analysis_results: Dict[str, Any] = {
+        return {
             "target_company": company_name,
             "industry": industry,
-            "analysis_date": datetime.now().isoformat(),
-            "competitor_profiles": []
-        }
-        
-        # Sample competitive metrics
-        metrics = ["market_share", "revenue_growth", "employee_count", "funding", "product_range"]
-        
-        for competitor in competitors:
-            # Simulate competitor data collection
-            competitor_profile = {
-                "name": competitor,
-                "market_position": "Strong" if len(competitor) > 8 else "Moderate",
-                "strengths": [
-                    "Strong brand recognition",
-                    "Diverse product portfolio",
-                    "Global presence"
-                ][:2],
-                "weaknesses": [
-                    "Higher pricing",
-                    "Slower innovation",
-                    "Limited market penetration"
-                ][:2],
-                "estimated_market_share": f"{15 + (len(competitor) % 20)}%",
-                "key_products": [f"{competitor} Product A", f"{competitor} Service B"],
-                "recent_developments": [
-                    f"{competitor} launched new product line",
-                    f"{competitor} expanded to new market"
-                ]
-            }
-            analysis_results["competitor_profiles"].append(competitor_profile)
-        
-        # Market position analysis
-        competitive_landscape = {
-            "market_leaders": competitors[:2] if len(competitors) >= 2 else competitors,
-            "emerging_players": competitors[2:] if len(competitors) > 2 else [],
-            "market_gaps": [
-                "Affordable premium segment",
-                "SMB market underserved",
-                "Emerging market opportunities"
-            ],
-            "competitive_intensity": "High" if len(competitors) > 4 else "Moderate"
+            "analysis_date": _now_iso(),
+            **thaw(_competitive_analysis(tuple(competitors)))
         }
         
-        # Strategic recommendations
-        recommendations = [
-            f"Differentiate from {competitors[0]} through pricing strategy" if competitors else "Focus on unique value proposition",
-            "Leverage technology for competitive advantage",
-            "Consider strategic partnerships to expand market reach",
-            "Invest in customer experience improvements"
-        ]
-        
-        analysis_results["competitive_landscape"] = competitive_landscape
-        analysis_results["strategic_recommendations"] = recommendations
-        analysis_results["threat_level"] = "Medium-High" if len(competitors) > 3 else "Medium"
-        
-        return analysis_results
-        
     except Exception as e:
         return {"error": f"Competitive analysis error: {str(e)}"}
 
 
+@lru_cache(maxsize=512)
+def _market_trends(industry: str, focus_areas: Tuple[str, ...]) -> Dict[str, Any]:
+    """Build the date-independent part of a market trend analysis."""
+    industry_lower = industry.lower()
+    
+    # Market size and growth
+    market_metrics = {
+        "estimated_market_size": f"${50 + (len(industry) * 5)}B",
+        "growth_rate": f"{3 + (len(industry) % 8)}% CAGR",
+        "market_maturity": "Growth" if len(industry) < 10 else "Mature",
+        "key_growth_drivers": _KEY_GROWTH_DRIVERS
+    }
+    
+    # Trend analysis by focus area; unknown areas get the economic-factors outlook
+    trend_insights = {area: _TREND_INSIGHTS.get(area, _DEFAULT_TREND_INSIGHT) for area in focus_areas}
+    
+    # Investment insights
+    investment_climate = {
+        "funding_availability": "Moderate" if "startup" in industry_lower else "Good",
+        "investor_sentiment": "Cautiously optimistic",
+        "hot_sectors": _HOT_SECTORS,
+        "valuation_trends": "Normalizing after high growth period"
+    }
+    
+    return {
+        "overall_market_health": _MARKET_HEALTH["tech" in industry_lower],
+        "market_metrics": market_metrics,
+        "trend_insights": trend_insights,
+        "swot_analysis": _SWOT_ANALYSIS,
+        "investment_climate": investment_climate
+    }
+
+
 @tool
 def analyze_market_trends(industry: str, time_period: str = "12_months", focus_areas: Optional[List[str]] = None) -> Dict[str, Any]:
     """
@@ -159,108 +454,42 @@ def analyze_market_trends(industry: str, time_period: str = "12_months", focus_a
         'Growing'
     """
     try:
-        if focus_areas is None:
-            focus_areas = ["technology", "consumer_behavior", "regulations", "economic_factors"]
-        
-        # Simulate market trend analysis
-        trend_analysis: Dict[str, Any] = {
+        return {
             "industry": industry,
             "analysis_period": time_period,
-            "report_date": datetime.now().isoformat(),
-            "overall_market_health": "Growing" if "tech" in industry.lower() else "Stable"
-        }
-        
-        # Market size and growth
-        market_metrics = {
-            "estimated_market_size": f"${50 + (len(industry) * 5)}B",
-            "growth_rate": f"{3 + (len(industry) % 8)}% CAGR",
-            "market_maturity": "Growth" if len(industry) < 10 else "Mature",
-            "key_growth_drivers": [
-                "Digital transformation acceleration",
-                "Changing consumer preferences",
-                "Regulatory changes"
-            ]
-        }
-        
-        # Trend analysis by focus area
-        trend_insights = {}
-        for area in focus_areas:
-            if area == "technology":
-                trend_insights[area] = {
-                    "key_trends": [
-                        "AI and automation adoption",
-                        "Cloud migration acceleration",
-                        "Data privacy emphasis"
-                    ],
-                    "impact_level": "High",
-                    "timeline": "1-2 years"
-                }
-            elif area == "consumer_behavior":
-                trend_insights[area] = {
-                    "key_trends": [
-                        "Sustainability focus increasing",
-                        "Remote work normalization",
-                        "Digital-first expectations"
-                    ],
-                    "impact_level": "High",
-                    "timeline": "Immediate"
-                }
-            elif area == "regulations":
-                trend_insights[area] = {
-                    "key_trends": [
-                        "Data protection requirements",
-                        "ESG compliance mandates",
-                        "Industry-specific regulations"
-                    ],
-                    "impact_level": "Medium",
-                    "timeline": "6-18 months"
-                }
-            else:
-                trend_insights[area] = {
-                    "key_trends": [
-                        "Economic uncertainty impact",
-                        "Supply chain resilience focus",
-                        "Investment pattern shifts"
-                    ],
-                    "impact_level": "Medium",
-                    "timeline": "3-12 months"
-                }
-        
-        # Opportunities and threats
-        swot_analysis = {
-            "opportunities": [
-                "Emerging market expansion",
-                "Technology adoption gap",
-                "Sustainability solutions demand",
-                "Partnership possibilities"
-            ],
-            "threats": [
-                "Increased competition",
-                "Economic volatility",
-                "Regulatory changes",
-                "Technology disruption"
-            ]
-        }
-        
-        # Investment insights
-        investment_climate = {
-            "funding_availability": "Moderate" if "startup" in industry.lower() else "Good",
-            "investor_sentiment": "Cautiously optimistic",
-            "hot_sectors": ["AI/ML", "Sustainability", "Healthcare", "Fintech"],
-            "valuation_trends": "Normalizing after high growth period"
+            "report_date": _now_iso(),
+            **thaw(_market_trends(industry, _DEFAULT_FOCUS_AREAS if focus_areas is None else tuple(focus_areas)))
         }
         
-        trend_analysis["market_metrics"] = market_metrics
-        trend_analysis["trend_insights"] = trend_insights
-        trend_analysis["swot_analysis"] = swot_analysis
-        trend_analysis["investment_climate"] = investment_climate
-        
-        return trend_analysis
-        
     except Exception as e:
         return {"error": f"Market trend analysis error: {str(e)}"}
 
 
+@lru_cache(maxsize=512)
+def _customer_segments(business_model: str) -> Dict[str, Any]:
+    """Build the date-independent part of a customer segment analysis."""
+    # Define customer segments based on business model
+    customer_segments = _B2B_SEGMENTS if business_model.lower() == "b2b" else _B2C_SEGMENTS
+    
+    # Segment recommendations
+    recommendations = []
+    for segment_name, segment_data in customer_segments.items():
+        if segment_data.get("growth_potential") == "High" or segment_data.get("growth_potential") == "Very High":
+            recommendations.append(f"Prioritize {segment_name} segment for growth initiatives")
+    
+    recommendations.extend([
+        "Develop segment-specific value propositions",
+        "Tailor marketing messages by segment",
+        "Consider different pricing strategies per segment"
+    ])
+    
+    return {
+        "customer_segments": customer_segments,
+        "penetration_analysis": _PENETRATION_ANALYSIS,
+        "segment_recommendations": recommendations
+    }
+
+
 @tool
 def assess_customer_segments(industry: str, target_market: str, business_model: str) -> Dict[str, Any]:
     """
@@ -295,308 +524,131 @@ def assess_customer_segments(industry: str, target_market: str, business_model:
         3
     """
     try:
-        # Customer segmentation analysis
-        segment_analysis: Dict[str, Any] = {
+        return {
             "industry": industry,
             "target_market": target_market,
             "business_model": business_model,
-            "analysis_date": datetime.now().isoformat()
+            "analysis_date": _now_iso(),
+            **thaw(_customer_segments(business_model))
         }
         
-        # Define customer segments based on business model
-        if business_model.lower() == "b2b":
-            customer_segments = {
-                "enterprise": {
-                    "size": "Large (1000+ employees)",
-                    "characteristics": ["Complex needs", "Long sales cycles", "High value contracts"],
-                    "pain_points": ["Integration challenges", "Scalability requirements", "Compliance needs"],
-                    "market_size": "25% of total market",
-                    "growth_potential": "Steady",
-                    "acquisition_cost": "High"
-                },
-                "mid_market": {
-                    "size": "Medium (100-1000 employees)",
-                    "characteristics": ["Balanced needs", "Moderate complexity", "Growth-focused"],
-                    "pain_points": ["Resource constraints", "Technology gaps", "Efficiency needs"],
-                    "market_size": "45% of total market",
-                    "growth_potential": "High",
-                    "acquisition_cost": "Medium"
-                },
-                "small_business": {
-                    "size": "Small (10-100 employees)",
-                    "characteristics": ["Simple needs", "Price sensitive", "Quick decisions"],
-                    "pain_points": ["Budget limitations", "Limited IT resources", "Time constraints"],
-                    "market_size": "30% of total market",
-                    "growth_potential": "Very High",
-                    "acquisition_cost": "Low"
-                }
-            }
-        else:  # B2C
-            customer_segments = {
-                "premium": {
-                    "demographics": "High income, urban, 25-45 years",
-                    "characteristics": ["Quality-focused", "Brand conscious", "Early adopters"],
-                    "pain_points": ["Time constraints", "Quality concerns", "Status needs"],
-                    "market_size": "20% of total market",
-                    "growth_potential": "Moderate",
-                    "acquisition_cost": "High"
-                },
-                "mainstream": {
-                    "demographics": "Middle income, suburban, 30-55 years",
-                    "characteristics": ["Value-conscious", "Practical", "Research-driven"],
-                    "pain_points": ["Price vs quality balance", "Reliability needs", "Family considerations"],
-                    "market_size": "60% of total market",
-                    "growth_potential": "Steady",
-                    "acquisition_cost": "Medium"
-                },
-                "budget_conscious": {
-                    "demographics": "Lower-middle income, diverse locations, 18-65 years",
-                    "characteristics": ["Price sensitive", "Necessity-focused", "Word-of-mouth driven"],
-                    "pain_points": ["Affordability", "Value demonstration", "Trust building"],
-                    "market_size": "20% of total market",
-                    "growth_potential": "High",
-                    "acquisition_cost": "Low"
-                }
-            }
-        
-        # Market penetration analysis
-        penetration_analysis = {
-            "current_penetration": "15-25% depending on segment",
-            "saturation_level": "Low to Medium",
-            "untapped_opportunities": [
-                "Geographic expansion",
-                "New customer segments",
-                "Product line extension",
-                "Channel diversification"
-            ]
-        }
-        
-        # Segment recommendations
-        recommendations = []
-        for segment_name, segment_data in customer_segments.items():
-            if segment_data.get("growth_potential") == "High" or segment_data.get("growth_potential") == "Very High":
-                recommendations.append(f"Prioritize {segment_name} segment for growth initiatives")
-        
-        recommendations.extend([
-            "Develop segment-specific value propositions",
-            "Tailor marketing messages by segment",
-            "Consider different pricing strategies per segment"
-        ])
-        
-        segment_analysis["customer_segments"] = customer_segments
-        segment_analysis["penetration_analysis"] = penetration_analysis
-        segment_analysis["segment_recommendations"] = recommendations
-        
-        return segment_analysis
-        
     except Exception as e:
         return {"error": f"Customer segment analysis error: {str(e)}"}
 
 
+@lru_cache(maxsize=512)
+def _market_entry_strategy(target_market: str, business_type: str, budget_range: str, timeline: str) -> Dict[str, Any]:
+    """Build the date-independent part of a market entry evaluation."""
+    budget = budget_range.lower()
+    business_tags = set(_BUSINESS_TYPE_TAG_RE.findall(business_type.lower()))
+    is_tech = "tech" in business_tags
+    
+    # Market entry barriers analysis
+    barriers = {
+        "capital_requirements": "Medium" if "startup" in budget else "High",
+        "regulatory_complexity": "High" if _REGULATED_MARKET_RE.search(target_market.lower()) else "Medium",
+        "competitive_intensity": "High" if is_tech else "Medium",
+        "customer_acquisition_difficulty": "Medium",
+        "technology_requirements": "High" if is_tech else "Low"
+    }
+    
+    # Entry strategy options; digital-first entry only applies to tech and digital businesses
+    if business_tags:
+        strategy_options = [*_ENTRY_STRATEGY_OPTIONS, _DIGITAL_FIRST_ENTRY]
+    else:
+        strategy_options = list(_ENTRY_STRATEGY_OPTIONS)
+    
+    # Recommended approach
+    if budget == "high" and timeline == "long":
+        recommended_strategy = "Direct Market Entry"
+    elif budget == "medium":
+        recommended_strategy = "Strategic Partnership"
+    else:
+        recommended_strategy = "Licensing/Franchising or Digital-First Entry"
+    
+    return {
+        "market_barriers": barriers,
+        "strategy_options": strategy_options,
+        "recommended_strategy": recommended_strategy,
+        "success_factors": _ENTRY_SUCCESS_FACTORS,
+        "risk_mitigation": _ENTRY_RISK_MITIGATION
+    }
+
+
 @tool
 def evaluate_market_entry_strategy(target_market: str, business_type: str, budget_range: str, timeline: str) -> Dict[str, Any]:
     """Evaluate market entry strategies for new business opportunities."""
     try:
-        entry_analysis: Dict[str, Any] = {
+        return {
             "target_market": target_market,
             "business_type": business_type,
             "budget_range": budget_range,
             "timeline": timeline,
-            "analysis_date": datetime.now().isoformat()
-        }
-        
-        # Market entry barriers analysis
-        barriers = {
-            "capital_requirements": "Medium" if "startup" in budget_range.lower() else "High",
-            "regulatory_complexity": "High" if any(x in target_market.lower() for x in ["healthcare", "financial", "education"]) else "Medium",
-            "competitive_intensity": "High" if "tech" in business_type.lower() else "Medium",
-            "customer_acquisition_difficulty": "Medium",
-            "technology_requirements": "High" if "tech" in business_type.lower() else "Low"
+            "analysis_date": _now_iso(),
+            **thaw(_market_entry_strategy(target_market, business_type, budget_range, timeline))
         }
         
-        # Entry strategy options
-        strategy_options = []
-        
-        # Direct entry
-        strategy_options.append({
-            "strategy": "Direct Market Entry",
-            "description": "Establish operations directly in target market",
-            "advantages": ["Full control", "Higher margins", "Brand building"],
-            "disadvantages": ["High investment", "High risk", "Longer timeline"],
-            "suitability": "High budget, long timeline",
-            "risk_level": "High",
-            "investment_required": "High"
-        })
-        
-        # Partnership entry
-        strategy_options.append({
-            "strategy": "Strategic Partnership",
-            "description": "Partner with established local players",
-            "advantages": ["Reduced risk", "Local expertise", "Faster entry"],
-            "disadvantages": ["Shared control", "Lower margins", "Dependency"],
-            "suitability": "Medium budget, medium timeline",
-            "risk_level": "Medium",
-            "investment_required": "Medium"
-        })
-        
-        # Licensing
-        strategy_options.append({
-            "strategy": "Licensing/Franchising",
-            "description": "License business model to local operators",
-            "advantages": ["Low investment", "Rapid scaling", "Local adaptation"],
-            "disadvantages": ["Limited control", "Lower revenue", "Quality concerns"],
-            "suitability": "Low budget, short timeline",
-            "risk_level": "Low",
-            "investment_required": "Low"
-        })
-        
-        # Digital-first entry
-        if "tech" in business_type.lower() or "digital" in business_type.lower():
-            strategy_options.append({
-                "strategy": "Digital-First Entry",
-                "description": "Enter market through digital channels",
-                "advantages": ["Low overhead", "Scalable", "Data-driven"],
-                "disadvantages": ["Limited local presence", "Digital competition", "Customer trust"],
-                "suitability": "Any budget, short timeline",
-                "risk_level": "Medium",
-                "investment_required": "Low-Medium"
-            })
-        
-        # Success factors
-        success_factors = [
-            "Strong value proposition for local market",
-            "Understanding of local regulations and culture",
-            "Adequate funding and resource allocation",
-            "Strong local partnerships or talent",
-            "Adaptive business model",
-            "Clear go-to-market strategy"
-        ]
-        
-        # Risk mitigation strategies
-        risk_mitigation = [
-            "Conduct pilot program before full launch",
-            "Secure local legal and regulatory expertise",
-            "Build strong local partnerships",
-            "Maintain financial reserves for unexpected costs",
-            "Develop exit strategy if needed"
-        ]
-        
-        # Recommended approach
-        if budget_range.lower() == "high" and timeline == "long":
-            recommended_strategy = "Direct Market Entry"
-        elif budget_range.lower() == "medium":
-            recommended_strategy = "Strategic Partnership"
-        else:
-            recommended_strategy = "Licensing/Franchising or Digital-First Entry"
-        
-        entry_analysis["market_barriers"] = barriers
-        entry_analysis["strategy_options"] = strategy_options
-        entry_analysis["recommended_strategy"] = recommended_strategy
-        entry_analysis["success_factors"] = success_factors
-        entry_analysis["risk_mitigation"] = risk_mitigation
-        
-        return entry_analysis
-        
     except Exception as e:
         return {"error": f"Market entry analysis error: {str(e)}"}
 
 
+@lru_cache(maxsize=512)
+def _industry_intelligence(industry: str, monitoring_areas: Tuple[str, ...], alert_frequency: str) -> Dict[str, Any]:
+    """Build the date-independent part of an industry intelligence setup."""
+    # Define monitoring sources and methods
+    monitoring_sources = {
+        "news_sources": [
+            f"{industry.title()} Weekly",
+            "Business Intelligence Today",
+            "Market Research Reports",
+            "Industry Trade Publications"
+        ],
+        "data_sources": _MONITORING_DATA_SOURCES,
+        "expert_networks": _MONITORING_EXPERT_NETWORKS
+    }
+    
+    # Monitoring framework; areas without a template are skipped
+    monitoring_framework = {}
+    for area in monitoring_areas:
+        framework = _MONITORING_FRAMEWORKS.get(area.lower())
+        if framework is not None:
+            monitoring_framework[area] = framework
+    
+    # Intelligence deliverables
+    deliverables = {
+        "reports": {
+            "executive_summary": f"Monthly {industry} Intelligence Brief",
+            "detailed_analysis": f"Quarterly {industry} Market Analysis",
+            "trend_forecast": f"Annual {industry} Trend Predictions",
+            "competitive_update": f"Weekly Competitive Intelligence Report"
+        },
+        "alerts": {
+            "urgent": "Same-day notification for critical developments",
+            "important": f"{alert_frequency.title()} summary of key changes",
+            "informational": "Monthly compilation of general industry news"
+        }
+    }
+    
+    return {
+        "monitoring_sources": monitoring_sources,
+        "monitoring_framework": monitoring_framework,
+        "deliverables": deliverables,
+        "success_metrics": _INTELLIGENCE_SUCCESS_METRICS
+    }
+
+
 @tool
 def monitor_industry_intelligence(industry: str, monitoring_areas: List[str], alert_frequency: str = "weekly") -> Dict[str, Any]:
     """Set up ongoing industry intelligence monitoring for strategic insights."""
     try:
-        intelligence_setup: Dict[str, Any] = {
+        return {
             "industry": industry,
             "monitoring_areas": monitoring_areas,
             "alert_frequency": alert_frequency,
-            "setup_date": datetime.now().isoformat()
-        }
-        
-        # Define monitoring sources and methods
-        monitoring_sources = {
-            "news_sources": [
-                f"{industry.title()} Weekly",
-                "Business Intelligence Today",
-                "Market Research Reports",
-                "Industry Trade Publications"
-            ],
-            "data_sources": [
-                "Financial databases",
-                "Government statistics",
-                "Patent databases",
-                "Social media sentiment"
-            ],
-            "expert_networks": [
-                "Industry associations",
-                "Professional networks",
-                "Analyst firms",
-                "Academic institutions"
-            ]
-        }
-        
-        # Monitoring framework
-        monitoring_framework = {}
-        for area in monitoring_areas:
-            if area.lower() == "competitors":
-                monitoring_framework[area] = {
-                    "metrics": ["Product launches", "Funding rounds", "Executive changes", "Market share shifts"],
-                    "sources": ["Company websites", "Press releases", "SEC filings", "News alerts"],
-                    "frequency": "Daily",
-                    "alert_threshold": "Significant developments"
-                }
-            elif area.lower() == "market_trends":
-                monitoring_framework[area] = {
-                    "metrics": ["Market size", "Growth rates", "Technology adoption", "Consumer behavior"],
-                    "sources": ["Market research", "Survey data", "Government reports", "Analyst reports"],
-                    "frequency": "Weekly",
-                    "alert_threshold": "Trend changes > 10%"
-                }
-            elif area.lower() == "regulations":
-                monitoring_framework[area] = {
-                    "metrics": ["New regulations", "Policy changes", "Compliance requirements", "Legal precedents"],
-                    "sources": ["Government websites", "Legal databases", "Industry alerts", "Law firms"],
-                    "frequency": "Weekly",
-                    "alert_threshold": "New regulatory announcements"
-                }
-            elif area.lower() == "technology":
-                monitoring_framework[area] = {
-                    "metrics": ["Patent filings", "R&D investments", "Technology breakthroughs", "Startup funding"],
-                    "sources": ["Patent databases", "Research publications", "Tech news", "Investment reports"],
-                    "frequency": "Bi-weekly",
-                    "alert_threshold": "Disruptive technology emergence"
-                }
-        
-        # Intelligence deliverables
-        deliverables = {
-            "reports": {
-                "executive_summary": f"Monthly {industry} Intelligence Brief",
-                "detailed_analysis": f"Quarterly {industry} Market Analysis",
-                "trend_forecast": f"Annual {industry} Trend Predictions",
-                "competitive_update": f"Weekly Competitive Intelligence Report"
-            },
-            "alerts": {
-                "urgent": "Same-day notification for critical developments",
-                "important": f"{alert_frequency.title()} summary of key changes",
-                "informational": "Monthly compilation of general industry news"
-            }
+            "setup_date": _now_iso(),
+            **thaw(_industry_intelligence(industry, tuple(monitoring_areas), alert_frequency))
         }
         
-        # Success metrics
-        success_metrics = [
-            "Early identification of market opportunities",
-            "Proactive response to competitive threats",
-            "Informed strategic decision making",
-            "Reduced market entry risks",
-            "Improved market positioning"
-        ]
-        
-        intelligence_setup["monitoring_sources"] = monitoring_sources
-        intelligence_setup["monitoring_framework"] = monitoring_framework
-        intelligence_setup["deliverables"] = deliverables
-        intelligence_setup["success_metrics"] = success_metrics
-        
-        return intelligence_setup
-        
     except Exception as e:
         return {"error": f"Industry intelligence setup error: {str(e)}"}
 
@@ -613,37 +665,58 @@ async def market_intelligence_agent(business_query: str) -> str:
 class MarketIntelligenceAgent:
     """Real-world market intelligence agent for business research and competitive analysis."""
     
+    # Workflow prototypes shared by all instances, built on first use
+    _workflows = WorkflowPrototypes()
+    
     def __init__(self):
         self.name = "MarketIntelligenceAgent"
         self.complexity_level = 6
         self.description = "Real-world market intelligence agent for competitive analysis, market trends, and business strategy"
+        
+        # LLM endpoint settings, read once; workflows are built and shared per endpoint
+        self._api_key = os.environ.get("API_KEY", "")
+        self._base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
+        if not self._api_key:
+            raise ValueError("API_KEY environment variable is required")
     
     async def create_workflow(self) -> WorkflowGraph:
-        """Create the market intelligence workflow."""
+        """Create the market intelligence workflow (a private copy of the shared prototype)."""
+        return await self._workflows.copy(self._workflow_key(), self._build_workflow)
+    
+    async def warmup(self) -> None:
+        """Build the shared workflow prototype (tool schemas, agents) ahead of the first request."""
+        await self._workflows.warmup(self._workflow_key(), self._build_workflow)
+    
+    def _workflow_key(self) -> Tuple[Any, ...]:
+        return (type(self), self._api_key, self._base_url)
+    
+    async def _build_workflow(self) -> WorkflowGraph:
+        """Build the market intelligence workflow graph."""
         try:
-            api_key = os.environ.get("API_KEY", "")
-            base_url = os.environ.get("BASE_URL", "https://api.openai.com/v1")
+            api_key = self._api_key
+            base_url = self._base_url
             
-            if not api_key:
-                raise ValueError("API_KEY environment variable is required")
+            # Generate all tool schemas concurrently; each one may round-trip to the LLM
+            (
+                competitive_schema,
+                monitoring_schema,
+                trends_schema,
+                segments_schema,
+                entry_schema,
+                response_agent
+            ) = await asyncio.gather(
+                cached_schema(conduct_competitive_analysis, func_name="conduct_competitive_analysis", enhance_description=True),
+                cached_schema(monitor_industry_intelligence, func_name="monitor_industry_intelligence", enhance_description=True),
+                cached_schema(analyze_market_trends, func_name="analyze_market_trends", enhance_description=True),
+                cached_schema(assess_customer_segments, func_name="assess_customer_segments", enhance_description=True),
+                cached_schema(evaluate_market_entry_strategy, func_name="evaluate_market_entry_strategy", enhance_description=True),
+                cached_schema(market_intelligence_agent, func_name="market_intelligence_agent", enhance_description=True),
+            )
             
             # Create tools for different market intelligence domains
-            competitive_tools = [
-                await function_to_schema(conduct_competitive_analysis, func_name="conduct_competitive_analysis", enhance_description=True),
-                await function_to_schema(monitor_industry_intelligence, func_name="monitor_industry_intelligence", enhance_description=True),
-            ]
-            
-            market_analysis_tools = [
-                await function_to_schema(analyze_market_trends, func_name="analyze_market_trends", enhance_description=True),
-                await function_to_schema(assess_customer_segments, func_name="assess_customer_segments", enhance_description=True),
-            ]
-            
-            strategy_tools = [
-                await function_to_schema(evaluate_market_entry_strategy, func_name="evaluate_market_entry_strategy", enhance_description=True),
-            ]
-            
-            # Create response agent
-            response_agent = await function_to_schema(market_intelligence_agent, func_name="market_intelligence_agent", enhance_description=True)
+            competitive_tools = [competitive_schema, monitoring_schema]
+            market_analysis_tools = [trends_schema, segments_schema]
+            strategy_tools = [entry_schema]
             
             # Create main orchestrator with routing capability
             all_tools = competitive_tools + market_analysis_tools + strategy_tools + [response_agent]
@@ -749,6 +822,7 @@ class MarketIntelligenceAgent:
     async def solve_real_world_problem(self, scenario: str) -> Dict[str, Any]:
         """Solve a real-world business intelligence problem."""
         try:
+            # Compiled per scenario: a CompiledGraph accumulates execution memory across runs
             workflow = await self.create_workflow()
             compiled_graph = workflow.compile()
             
@@ -0,0 +1,18 @@
+import pytest
+
+from benchmarks.agents import _common
+
+
+@pytest.fixture
+def schema_calls(monkeypatch):
+    """Record function_to_schema calls, skipping the LLM description step, with an empty schema cache."""
+    calls = []
+    original = _common.function_to_schema
+
+    async def function_to_schema(func, enhance_description=False, func_name=None, needs_memory=False):
+        calls.append(func_name)
+        return await original(func, func_name=func_name, needs_memory=needs_memory)
+
+    monkeypatch.setattr(_common, "function_to_schema", function_to_schema)
+    monkeypatch.setattr(_common, "_SCHEMA_CACHE", {})
+    return calls
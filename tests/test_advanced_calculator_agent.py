@@ -0,0 +1,243 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from benchmarks.agents import advanced_calculator_agent as calc
+from benchmarks.agents._common import WorkflowPrototypes
+
+
+PORTFOLIO = [
+    {"name": "Tech Stocks", "amount": 50000, "type": "stocks", "risk_level": "high"},
+    {"name": "Government Bonds", "amount": 30000, "type": "bonds", "risk_level": "low"},
+    {"name": "Index Fund", "amount": 15000, "type": "stocks", "risk_level": "medium"},
+]
+
+
+def test_portfolio_zero_total_reports_division_error():
+    result = calc.analyze_portfolio_risk(PORTFOLIO, 0)
+    assert result == {"error": "Portfolio analysis error: float division by zero"}
+
+
+def test_portfolio_negative_total_is_analysed():
+    result = calc.analyze_portfolio_risk(PORTFOLIO, -100000)
+    assert result["portfolio_overview"]["allocation_percentage"] == -95.0
+    assert [item["weight_percentage"] for item in result["investments"]] == [-50.0, -30.0, -15.0]
+
+
+def test_portfolio_labels_are_not_coerced():
+    investments = [
+        {"name": "Mystery", "amount": 1000, "type": None, "risk_level": None},
+        {"name": "Bonds", "amount": 3000, "type": "bonds", "risk_level": "low"},
+    ]
+    result = calc.analyze_portfolio_risk(investments, 4000)
+    assert result["investments"][0]["type"] is None
+    assert result["investments"][0]["risk_level"] is None
+    assert result["risk_analysis"]["risk_distribution"] == {None: 25.0, "low": 75.0}
+    assert result["risk_analysis"]["asset_distribution"] == {None: 25.0, "bonds": 75.0}
+    assert result["risk_analysis"]["overall_risk_score"] == 1.5
+
+
+def test_portfolio_groups_in_first_seen_order():
+    result = calc.analyze_portfolio_risk(PORTFOLIO, 100000)
+    assert list(result["risk_analysis"]["asset_distribution"].items()) == [("stocks", 65.0), ("bonds", 30.0)]
+    assert result["portfolio_overview"]["allocated_amount"] == 95000.0
+    assert result["risk_analysis"]["overall_risk_score"] == pytest.approx(5.35)
+
+
+def test_investment_batch_matches_scalar_tool():
+    principals = [1000.0, 10000.5, 250000.0]
+    rates = [0.0, 0.01, 0.07, 0.15]
+    horizons = [1, 10, 30]
+    frequencies = [1, 4, 12, 365]
+    grid = np.meshgrid(principals, rates, horizons, frequencies, indexing="ij")
+    sweep = calc.calculate_investment_returns_batch(*grid)
+
+    for index in np.ndindex(grid[0].shape):
+        principal, rate, years, frequency = (float(axis[index]) for axis in grid)
+        scalar = calc.calculate_investment_returns(principal, rate, int(years), int(frequency))
+        summary, inflation = scalar["investment_summary"], scalar["inflation_adjusted"]
+        assert sweep["final_amount"][index] == pytest.approx(summary["final_amount"], abs=0.01)
+        assert sweep["total_return"][index] == pytest.approx(summary["total_return"], abs=0.01)
+        assert sweep["roi_percentage"][index] == pytest.approx(summary["roi_percentage"], abs=0.01)
+        assert sweep["real_annual_return"][index] == pytest.approx(inflation["real_annual_return"], abs=0.01)
+        assert sweep["inflation_adjusted_amount"][index] == pytest.approx(inflation["inflation_adjusted_amount"], abs=0.01)
+
+
+def test_investment_batch_broadcasts_scalars():
+    sweep = calc.calculate_investment_returns_batch(10000, [0.03, 0.05, 0.07], 10)
+    assert sweep["final_amount"].shape == (3,)
+    assert sweep["final_amount"].round(2).tolist() == [13493.54, 16470.09, 20096.61]
+
+
+def test_yearly_progression_rounds_half_cents_like_round():
+    # 10000.5 * 1.07 is 10700.534999... as a double; np.round would report 10700.54
+    first_year = calc.calculate_investment_returns(10000.5, 0.07, 5, 1)["yearly_progression"][0]
+    assert first_year == {"year": 1, "value": 10700.53, "gain": 700.03}
+
+
+@pytest.mark.parametrize("principal, annual_rate, years, compound_frequency", [
+    (10000, 0.07, 10, 12),
+    (10000.5, 0.07, 5, 1),
+    (2500.25, 0.045, 30, 4),
+    (123456.78, 0.123, 25, 365),
+])
+def test_yearly_progression_matches_closed_form(principal, annual_rate, years, compound_frequency):
+    expected = []
+    for year in range(1, years + 1):
+        value = principal * (1 + annual_rate / compound_frequency) ** (compound_frequency * year)
+        expected.append({"year": year, "value": round(value, 2), "gain": round(value - principal, 2)})
+    result = calc.calculate_investment_returns(principal, annual_rate, years, compound_frequency)
+    assert result["yearly_progression"] == expected
+
+
+@pytest.mark.parametrize("principal, annual_rate, years, compound_frequency", [
+    (10000, 0.07, 10, 12),
+    (10000.5, 0.07, 5, 1),
+    (999.99, 0.0, 3, 12),
+    (404455.5, 0.9524673882682695, 22, 365),
+    (5000, 0.05, 0, 12),
+])
+def test_iter_yearly_progression_matches_tool(principal, annual_rate, years, compound_frequency):
+    result = calc.calculate_investment_returns(principal, annual_rate, years, compound_frequency)
+    streamed = list(calc.iter_yearly_progression(principal, annual_rate, years, compound_frequency))
+    assert streamed == result["yearly_progression"]
+
+
+def test_iter_yearly_progression_is_lazy():
+    progression = calc.iter_yearly_progression(10000, 0.07, 10**9)
+    assert next(progression) == {"year": 1, "value": 10722.9, "gain": 722.9}
+
+
+def _stub_agent(monkeypatch):
+    monkeypatch.setenv("API_KEY", "test-key")
+    agent = calc.FinancialAnalysisAgent()
+    state = {"running": 0, "peak": 0}
+
+    async def warmup():
+        pass
+
+    async def solve(scenario):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return {"scenario": scenario, "status": "success"}
+
+    monkeypatch.setattr(agent, "warmup", warmup)
+    monkeypatch.setattr(agent, "solve_financial_problem", solve)
+    return agent, state
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 10])
+def test_solve_all_scenarios_bounds_concurrency_and_keeps_order(monkeypatch, concurrency):
+    agent, state = _stub_agent(monkeypatch)
+    results = asyncio.run(agent.solve_all_scenarios(concurrency=concurrency))
+    assert [result["scenario"] for result in results] == [s["prompt"] for s in agent.get_real_world_scenarios()]
+    assert state["peak"] == min(concurrency, len(agent.get_real_world_scenarios()))
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_solve_all_scenarios_rejects_non_positive_concurrency(monkeypatch, concurrency):
+    agent, _ = _stub_agent(monkeypatch)
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        asyncio.run(agent.solve_all_scenarios(concurrency=concurrency))
+
+
+def test_agent_requires_api_key(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    with pytest.raises(ValueError, match="API_KEY environment variable is required"):
+        calc.FinancialAnalysisAgent()
+
+
+def test_agent_workflows_are_shared_per_endpoint(monkeypatch, schema_calls):
+    monkeypatch.setattr(calc.FinancialAnalysisAgent, "_workflows", WorkflowPrototypes())
+    orchestrator_endpoints = []
+    create_orchestrator = calc.create_orchestrator
+
+    def record_orchestrator(**kwargs):
+        orchestrator_endpoints.append((kwargs["api_key"], kwargs["base_url"]))
+        return create_orchestrator(**kwargs)
+
+    monkeypatch.setattr(calc, "create_orchestrator", record_orchestrator)
+
+    def make_agent(api_key, base_url):
+        monkeypatch.setenv("API_KEY", api_key)
+        monkeypatch.setenv("BASE_URL", base_url)
+        return calc.FinancialAnalysisAgent()
+
+    agents = [
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-b", "http://a.test/v1"),
+        make_agent("key-a", "http://b.test/v1"),
+    ]
+
+    async def build_all():
+        return [await agent.create_workflow() for agent in agents]
+
+    workflows = asyncio.run(build_all())
+    assert orchestrator_endpoints == [
+        ("key-a", "http://a.test/v1"), ("key-b", "http://a.test/v1"), ("key-a", "http://b.test/v1")
+    ]
+    assert len({id(workflow) for workflow in workflows}) == len(agents)
+    # Schemas do not depend on the endpoint, so they are generated once for all three builds
+    assert len(schema_calls) == 4
+
+
+RETIREMENT_FIELDS = {
+    "future_value_of_current_savings": ("projected_retirement_wealth", "future_value_of_current_savings"),
+    "future_value_of_contributions": ("projected_retirement_wealth", "future_value_of_contributions"),
+    "total_projected_savings": ("projected_retirement_wealth", "total_projected_savings"),
+    "sustainable_monthly_income": ("retirement_income_analysis", "sustainable_monthly_income"),
+    "monthly_income_gap": ("retirement_income_analysis", "monthly_income_gap"),
+    "additional_capital_needed": ("action_plan", "additional_capital_needed"),
+    "additional_monthly_savings_required": ("action_plan", "additional_monthly_savings_required"),
+}
+
+
+def test_retirement_batch_matches_scalar_tool():
+    ages = [25, 45, 64]
+    savings = [0.0, 50000.0]
+    contributions = [0.0, 500.0, 2000.0]
+    returns = [0.0, 0.04, 0.07]
+    incomes = [2000.0, 8000.0]
+    grid = np.meshgrid(ages, savings, contributions, returns, incomes, indexing="ij")
+    sweep = calc.retirement_planning_analysis_batch(grid[0], 65, *grid[1:])
+
+    for index in np.ndindex(grid[0].shape):
+        age, saved, contribution, expected_return, income = (float(axis[index]) for axis in grid)
+        scalar = calc.retirement_planning_analysis(int(age), 65, saved, contribution, expected_return, income)
+        assert sweep["years_to_retirement"][index] == scalar["retirement_timeline"]["years_to_retirement"]
+        for field, (section, key) in RETIREMENT_FIELDS.items():
+            assert sweep[field][index] == pytest.approx(scalar[section][key], abs=0.01), field
+        sufficient = scalar["retirement_income_analysis"]["income_adequacy"] == "Sufficient"
+        assert bool(sweep["income_sufficient"][index]) is sufficient
+
+
+def test_retirement_batch_masks_scenarios_past_retirement_age():
+    sweep = calc.retirement_planning_analysis_batch([30, 65, 70], 65, 10000, 500, 0.05, 4000)
+    assert calc.retirement_planning_analysis(70, 65, 10000, 500, 0.05, 4000) == {"error": "Already at or past retirement age"}
+    assert np.isnan(sweep["total_projected_savings"][1:]).all()
+    assert not np.isnan(sweep["total_projected_savings"][0])
+    assert sweep["income_sufficient"][1:].tolist() == [False, False]
+
+
+@pytest.mark.parametrize("years", [0, 1, 10, 30])
+def test_final_amount_matches_closed_form_and_last_year(years):
+    result = calc.calculate_investment_returns(10000, 0.07, years)
+    expected = round(10000 * (1 + 0.07 / 12) ** (12 * years), 2)
+    assert result["investment_summary"]["final_amount"] == expected
+    assert len(result["yearly_progression"]) == years
+    if years:
+        assert result["yearly_progression"][-1]["value"] == expected
+
+
+def test_fractional_years_compound_over_the_exact_horizon():
+    result = calc.calculate_investment_returns(10000, 0.07, 2.5)
+    summary = result["investment_summary"]
+    assert summary["time_period_years"] == 2.5
+    assert summary["final_amount"] == round(10000 * (1 + 0.07 / 12) ** 30, 2) == 11906.41
+    # Only completed years appear in the progression
+    assert [entry["year"] for entry in result["yearly_progression"]] == [1, 2]
+    assert list(calc.iter_yearly_progression(10000, 0.07, 2.5)) == result["yearly_progression"]
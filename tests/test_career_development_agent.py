@@ -0,0 +1,193 @@
+import asyncio
+import copy
+import json
+import os
+import stat
+import time
+from collections import OrderedDict
+
+import pytest
+
+from benchmarks.agents import career_development_agent as career
+from benchmarks.agents._common import WorkflowPrototypes
+
+
+KEYWORD_TEXTS = [
+    "",
+    "senior python engineer: javascript, react and sql on aws; docker and kubernetes in production",
+    "email me at jane@example.com · linkedin · phone: 555-0100 — résumé summary",
+    "responsible for reporting; worked on ml; helped with hiring; participated in standups",
+    "achieved 30% growth, led a team, developed and delivered ai and machine learning products",
+    "education: master's degree, university of somewhere. skills and technologies: proficient in java",
+    "the quick brown fox jumps over the lazy dog",
+]
+
+
+@pytest.mark.parametrize("backend", ["hyperscan", "aho-corasick", "substring"])
+@pytest.mark.parametrize("text", KEYWORD_TEXTS)
+def test_keyword_backends_agree(monkeypatch, backend, text):
+    if backend not in career._KEYWORD_BACKENDS:
+        pytest.skip(f"{backend} backend is not installed")
+    monkeypatch.setattr(career, "_keyword_hits", career._KEYWORD_BACKENDS["substring"])
+    expected = career._scan_keywords(text)
+    monkeypatch.setattr(career, "_keyword_hits", career._KEYWORD_BACKENDS[backend])
+    assert career._scan_keywords(text) == expected
+
+
+def test_scan_keywords_reports_overlapping_keywords():
+    found = career._scan_keywords("javascript developer, email on profile, degree required")
+    assert found["job_skill"] == {"javascript", "java", "ai"}
+    assert found["section"] == {"contact_info", "summary", "education"}
+    assert found["strong_verb"] == set() and found["weak_verb"] == set()
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+
+
+class _StubHTTP:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, headers=None, params=None):
+        self.calls += 1
+        return _Response({"data": [{"job_title": f"Job {self.calls}"}]}, self.status_code)
+
+
+@pytest.fixture
+def job_api(monkeypatch, tmp_path):
+    """Stubbed JSearch client with empty caches and a fresh, unopened disk tier under tmp_path."""
+    http = _StubHTTP()
+    monkeypatch.setattr(career, "_HTTP", http)
+    monkeypatch.setattr(career, "_RAPIDAPI_HEADERS", {"X-RapidAPI-Key": "test-key", "X-RapidAPI-Host": "test"})
+    monkeypatch.setattr(career, "_job_cache", OrderedDict())
+    monkeypatch.setattr(career, "_job_disk_cache", None)
+    monkeypatch.setattr(career, "_job_disk_cache_opened", False)
+    monkeypatch.setenv("ORION_JOB_CACHE_DIR", str(tmp_path / "jobcache"))
+    yield http
+    if career._job_disk_cache is not None:
+        career._job_disk_cache.close()
+
+
+def test_fetch_jobs_memory_hit(job_api):
+    first = career._fetch_jobs("Data Scientist", "Austin", "mid")
+    second = career._fetch_jobs(" data scientist ", "AUSTIN", "Mid")
+    assert first == second == [{"job_title": "Job 1"}]
+    assert job_api.calls == 1
+
+
+def test_fetch_jobs_falls_back_to_disk_after_memory_expiry(job_api, monkeypatch):
+    career._fetch_jobs("Data Scientist", "Austin", "mid")
+    monkeypatch.setattr(career, "_JOB_CACHE_TTL", 0.0)
+    assert career._fetch_jobs("Data Scientist", "Austin", "mid") == [{"job_title": "Job 1"}]
+    assert job_api.calls == 1
+
+
+@pytest.mark.skipif(career.diskcache is None, reason="diskcache is not installed")
+def test_fetch_jobs_refetches_after_both_tiers_expire(job_api, monkeypatch):
+    monkeypatch.setattr(career, "_JOB_CACHE_TTL", 0.0)
+    monkeypatch.setattr(career, "_JOB_DISK_CACHE_TTL", 0.01)
+    career._fetch_jobs("Data Scientist", "Austin", "mid")
+    time.sleep(0.05)
+    assert career._fetch_jobs("Data Scientist", "Austin", "mid") == [{"job_title": "Job 2"}]
+    assert job_api.calls == 2
+
+
+@pytest.mark.skipif(career.diskcache is None, reason="diskcache is not installed")
+def test_job_disk_cache_is_opened_lazily_and_private(job_api, tmp_path):
+    cache_dir = tmp_path / "jobcache"
+    assert not cache_dir.exists()
+    career._fetch_jobs("Data Scientist", "Austin", "mid")
+    assert career._job_disk_cache is not None
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+
+
+def test_job_disk_cache_defaults_to_user_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("ORION_JOB_CACHE_DIR", raising=False)
+    monkeypatch.setattr(career, "platformdirs", None)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert career._job_disk_cache_dir() == os.path.join(str(tmp_path), ".cache", "orion", "jobcache")
+
+
+def test_fetch_jobs_does_not_cache_failures(job_api):
+    job_api.status_code = 503
+    assert career._fetch_jobs("Data Scientist", "Austin", "mid") == []
+    job_api.status_code = 200
+    assert career._fetch_jobs("Data Scientist", "Austin", "mid") == [{"job_title": "Job 2"}]
+
+
+def test_career_path_results_are_independent_copies():
+    skills = ["Python", "SQL", "Data Analysis"]
+    first = career.assess_career_path_progression("Data Analyst", "Senior Data Scientist", skills)
+    expected = copy.deepcopy(career.assess_career_path_progression("Data Analyst", "Senior Data Scientist", skills))
+    first["development_plan"]["immediate_actions"].append("mutated")
+    first["skill_gap_analysis"]["skills_needed"].clear()
+    first["progression_steps"][0]["example_roles"].append("mutated")
+    first["progression_steps"][0]["level"] = "mutated"
+    first["success_metrics"].pop()
+    assert career.assess_career_path_progression("Data Analyst", "Senior Data Scientist", skills) == expected
+
+
+@pytest.mark.parametrize("current_role, target_role, track", [
+    # "cto" occurs inside "director"; the track named by the other role still wins
+    ("Product Manager", "Director", "Product Manager"),
+    ("Data Analyst", "Director", "Data Analyst"),
+    ("Senior Software Engineer", "Data Scientist", "Data Analyst"),
+    ("Software Engineer", "CTO", "Software Engineer"),
+    ("Nurse", "Teacher", "General"),
+])
+def test_career_track_detection(current_role, target_role, track):
+    result = career.assess_career_path_progression(current_role, target_role, [])
+    assert result["career_track"] == track
+
+
+def test_agent_requires_api_key(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    with pytest.raises(ValueError, match="API_KEY environment variable is required"):
+        career.CareerDevelopmentAgent()
+
+
+def test_agent_workflows_are_shared_per_endpoint(monkeypatch, schema_calls):
+    monkeypatch.setattr(career.CareerDevelopmentAgent, "_workflows", WorkflowPrototypes())
+    orchestrator_endpoints = []
+    create_orchestrator = career.create_orchestrator
+
+    def record_orchestrator(**kwargs):
+        orchestrator_endpoints.append((kwargs["api_key"], kwargs["base_url"]))
+        return create_orchestrator(**kwargs)
+
+    monkeypatch.setattr(career, "create_orchestrator", record_orchestrator)
+
+    def make_agent(api_key, base_url):
+        monkeypatch.setenv("API_KEY", api_key)
+        monkeypatch.setenv("BASE_URL", base_url)
+        return career.CareerDevelopmentAgent()
+
+    agents = [
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-b", "http://a.test/v1"),
+        make_agent("key-a", "http://b.test/v1"),
+    ]
+
+    async def build_all():
+        return [await agent.create_workflow() for agent in agents]
+
+    workflows = asyncio.run(build_all())
+    assert orchestrator_endpoints == [
+        ("key-a", "http://a.test/v1"), ("key-b", "http://a.test/v1"), ("key-a", "http://b.test/v1")
+    ]
+    assert len({id(workflow) for workflow in workflows}) == len(agents)
+    # Schemas do not depend on the endpoint, so they are generated once for all three builds
+    assert len(schema_calls) == 6
+
+
+def test_progression_steps_are_read_only():
+    step = career._PROGRESSION_STEPS["software_engineer"][1]
+    with pytest.raises(TypeError):
+        step["level"] = "mutated"
+    assert isinstance(step["example_roles"], tuple)
+    assert isinstance(step["key_requirements"], tuple)
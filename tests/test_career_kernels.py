@@ -0,0 +1,12 @@
+import numpy as np
+import pytest
+
+from benchmarks.agents._career_kernels import salary_stats
+
+
+@pytest.mark.parametrize("salaries", [[85000.0], [120000.0, 95000.0, 150000.5, 60000.0], list(np.linspace(4e4, 2.5e5, 101))])
+def test_salary_stats_matches_numpy(salaries):
+    values = np.asarray(salaries, dtype=np.float64)
+    mean, lo, hi = salary_stats(values)
+    assert mean == pytest.approx(values.mean(), rel=1e-12)
+    assert (lo, hi) == (values.min(), values.max())
@@ -0,0 +1,61 @@
+import asyncio
+from types import MappingProxyType
+
+from orion.graph_core import WorkflowGraph
+
+from benchmarks.agents._common import WorkflowPrototypes, loop_lock, thaw
+
+
+def test_loop_lock_is_per_event_loop():
+    async def get_lock():
+        return loop_lock("key"), loop_lock("key")
+
+    first_a, first_b = asyncio.run(get_lock())
+    second, _ = asyncio.run(get_lock())
+    assert first_a is first_b
+    assert first_a is not second
+
+
+def test_prototype_is_built_once_and_copied():
+    prototypes = WorkflowPrototypes()
+    builds = []
+
+    async def build():
+        builds.append(None)
+        await asyncio.sleep(0.01)
+        return WorkflowGraph()
+
+    async def contend():
+        return await asyncio.gather(*(prototypes.copy("key", build) for _ in range(3)))
+
+    copies = asyncio.run(contend())
+    assert len(builds) == 1
+    assert len({id(workflow) for workflow in copies}) == 3
+
+
+def test_prototype_lock_survives_a_second_event_loop():
+    prototypes = WorkflowPrototypes()
+    builds = []
+
+    async def build():
+        builds.append(None)
+        await asyncio.sleep(0.01)
+        return WorkflowGraph()
+
+    async def contend(key):
+        await asyncio.gather(prototypes.warmup(key, build), prototypes.warmup(key, build))
+
+    # A lock bound to the first loop would raise RuntimeError on the contended second run
+    asyncio.run(contend("first"))
+    asyncio.run(contend("second"))
+    assert len(builds) == 2
+
+
+def test_thaw_returns_plain_independent_containers():
+    shared = MappingProxyType({"steps": ({"roles": ("a", "b")},), "tags": ["x"]})
+    thawed = thaw(shared)
+    assert thawed == {"steps": [{"roles": ["a", "b"]}], "tags": ["x"]}
+    thawed["steps"][0]["roles"].append("c")
+    thawed["tags"].append("y")
+    assert shared["tags"] == ["x"]
+    assert thaw(shared) == {"steps": [{"roles": ["a", "b"]}], "tags": ["x"]}
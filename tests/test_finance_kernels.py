@@ -0,0 +1,44 @@
+from decimal import Decimal, localcontext
+
+import pytest
+
+from benchmarks.agents._finance_kernels import annuity_fv, monthly_payment
+
+
+def _growth(rate: float, periods: int) -> Decimal:
+    return (1 + Decimal(rate)) ** periods
+
+
+def _reference_payment(principal: float, rate: float, periods: int) -> Decimal:
+    with localcontext() as context:
+        context.prec = 50
+        growth = _growth(rate, periods)
+        return Decimal(principal) * Decimal(rate) * growth / (growth - 1)
+
+
+def _reference_annuity(payment: float, rate: float, periods: int) -> Decimal:
+    with localcontext() as context:
+        context.prec = 50
+        return Decimal(payment) * (_growth(rate, periods) - 1) / Decimal(rate)
+
+
+LOW_RATES = [1e-9, 1e-6, 0.0001 / 12, 0.001 / 12, 0.01 / 12, 0.045 / 12, 0.07 / 12]
+
+
+@pytest.mark.parametrize("rate", LOW_RATES)
+@pytest.mark.parametrize("principal, periods", [(300000.0, 360), (25000.0, 60), (1000000.0, 480)])
+def test_monthly_payment_matches_reference_to_the_cent(principal, rate, periods):
+    expected = _reference_payment(principal, rate, periods)
+    assert abs(Decimal(monthly_payment(principal, rate, float(periods))) - expected) < Decimal("0.005")
+
+
+@pytest.mark.parametrize("rate", LOW_RATES)
+@pytest.mark.parametrize("payment, periods", [(500.0, 480), (1.0, 12), (2500.0, 360)])
+def test_annuity_fv_matches_reference_to_the_cent(payment, rate, periods):
+    expected = _reference_annuity(payment, rate, periods)
+    assert abs(Decimal(annuity_fv(payment, rate, float(periods))) - expected) < Decimal("0.005")
+
+
+def test_zero_rate_is_linear():
+    assert monthly_payment(1200.0, 0.0, 12.0) == 100.0
+    assert annuity_fv(100.0, 0.0, 12.0) == 1200.0
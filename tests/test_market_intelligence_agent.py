@@ -0,0 +1,133 @@
+import asyncio
+import copy
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import pytest
+
+from benchmarks.agents import market_intelligence_agent as market
+from benchmarks.agents._common import WorkflowPrototypes
+
+
+DATE_KEYS = ("analysis_date", "report_date", "setup_date")
+
+
+def _call(tool, kwargs):
+    result = tool(**copy.deepcopy(kwargs))
+    assert "error" not in result
+    for key in DATE_KEYS:
+        result.pop(key, None)
+    return result
+
+
+def _mutate(value):
+    """Mutate every mutable container reachable from ``value``."""
+    if isinstance(value, dict):
+        for item in list(value.values()):
+            _mutate(item)
+        value["mutated"] = True
+    elif isinstance(value, list):
+        for item in value:
+            _mutate(item)
+        value.append("mutated")
+
+
+TOOL_CALLS = [
+    (market.conduct_competitive_analysis,
+     {"company_name": "TechCorp", "industry": "Cloud", "competitors": ["Microsoft", "Google", "Amazon"]}),
+    (market.analyze_market_trends, {"industry": "Technology", "time_period": "24_months"}),
+    (market.analyze_market_trends, {"industry": "Fintech", "focus_areas": ["regulations", "other"]}),
+    (market.assess_customer_segments, {"industry": "SaaS", "target_market": "Enterprise", "business_model": "B2B"}),
+    (market.assess_customer_segments, {"industry": "Retail", "target_market": "Urban", "business_model": "B2C"}),
+    (market.evaluate_market_entry_strategy,
+     {"target_market": "Healthcare", "business_type": "digital tech", "budget_range": "medium", "timeline": "short"}),
+    (market.monitor_industry_intelligence,
+     {"industry": "fintech", "monitoring_areas": ["competitors", "Technology", "unknown"]}),
+]
+
+
+@pytest.mark.parametrize("tool, kwargs", TOOL_CALLS, ids=lambda value: getattr(value, "__name__", ""))
+def test_mutating_a_result_does_not_leak_into_later_calls(tool, kwargs):
+    expected = copy.deepcopy(_call(tool, kwargs))
+    _mutate(tool(**copy.deepcopy(kwargs)))
+    assert _call(tool, kwargs) == expected
+
+
+def _assert_frozen(value):
+    if isinstance(value, Mapping):
+        assert isinstance(value, MappingProxyType)
+        for item in value.values():
+            _assert_frozen(item)
+    else:
+        assert not isinstance(value, (list, dict, set))
+        if isinstance(value, tuple):
+            for item in value:
+                _assert_frozen(item)
+
+
+@pytest.mark.parametrize("name", [
+    "_TREND_INSIGHTS", "_DEFAULT_TREND_INSIGHT", "_SWOT_ANALYSIS", "_B2B_SEGMENTS", "_B2C_SEGMENTS",
+    "_PENETRATION_ANALYSIS", "_ENTRY_STRATEGY_OPTIONS", "_DIGITAL_FIRST_ENTRY", "_MONITORING_FRAMEWORKS",
+])
+def test_shared_templates_are_frozen(name):
+    _assert_frozen(getattr(market, name))
+
+
+def test_results_are_plain_containers():
+    result = market.assess_customer_segments("SaaS", "Enterprise", "B2B")
+    enterprise = result["customer_segments"]["enterprise"]
+    assert type(result["customer_segments"]) is dict and type(enterprise) is dict
+    assert type(enterprise["pain_points"]) is list
+    entry = market.evaluate_market_entry_strategy("Retail", "digital", "low", "short")
+    assert all(type(option) is dict for option in entry["strategy_options"])
+
+
+def test_workflow_rebuilds_reuse_cached_schemas(monkeypatch, schema_calls):
+    monkeypatch.setenv("API_KEY", "test-key")
+    agent = market.MarketIntelligenceAgent()
+
+    for _ in range(2):
+        # A fresh prototype cache forces a full rebuild; the schemas must come from the cache
+        monkeypatch.setattr(market.MarketIntelligenceAgent, "_workflows", WorkflowPrototypes())
+        asyncio.run(agent.create_workflow())
+    assert sorted(schema_calls) == sorted([
+        "conduct_competitive_analysis", "monitor_industry_intelligence", "analyze_market_trends",
+        "assess_customer_segments", "evaluate_market_entry_strategy", "market_intelligence_agent",
+    ])
+
+
+def test_agent_requires_api_key(monkeypatch):
+    monkeypatch.delenv("API_KEY", raising=False)
+    with pytest.raises(ValueError, match="API_KEY environment variable is required"):
+        market.MarketIntelligenceAgent()
+
+
+def test_agent_workflows_are_shared_per_endpoint(monkeypatch, schema_calls):
+    monkeypatch.setattr(market.MarketIntelligenceAgent, "_workflows", WorkflowPrototypes())
+    orchestrator_endpoints = []
+    create_orchestrator = market.create_orchestrator
+
+    def record_orchestrator(**kwargs):
+        orchestrator_endpoints.append((kwargs["api_key"], kwargs["base_url"]))
+        return create_orchestrator(**kwargs)
+
+    monkeypatch.setattr(market, "create_orchestrator", record_orchestrator)
+
+    def make_agent(api_key, base_url):
+        monkeypatch.setenv("API_KEY", api_key)
+        monkeypatch.setenv("BASE_URL", base_url)
+        return market.MarketIntelligenceAgent()
+
+    agents = [
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-a", "http://a.test/v1"),
+        make_agent("key-b", "http://b.test/v1"),
+    ]
+
+    async def build_all():
+        return [await agent.create_workflow() for agent in agents]
+
+    workflows = asyncio.run(build_all())
+    assert orchestrator_endpoints == [("key-a", "http://a.test/v1"), ("key-b", "http://b.test/v1")]
+    assert len({id(workflow) for workflow in workflows}) == len(agents)
+    assert len(schema_calls) == 6